@@ -0,0 +1,333 @@
+"""
+Módulo com a classe Automato compartilhada pelos scripts das questões e com a tabela de
+transições compilada que ela utiliza para validar as cadeias.
+"""
+import varredura
+from minimizacao import quociente
+
+class TabelaCompilada:
+  """
+  Classe TabelaCompilada responsável por representar um autômato em uma tabela densa, em que os
+  estados são numerados por inteiros, os símbolos do alfabeto são agrupados em classes e as
+  transições ausentes levam a um estado morto explícito.
+  """
+  def __init__(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais):
+    """
+    Inicializa a tabela compilada a partir da representação algébrica do autômato.
+
+    Atributos:
+      - nomes: Uma lista com o estado original correspondente a cada número de estado.
+      - simbolos: Uma lista com o símbolo correspondente a cada classe do alfabeto.
+      - classes: Um dicionário que associa cada símbolo do alfabeto à sua classe.
+      - largura: A quantidade de colunas de cada linha da tabela.
+      - delta: Uma lista plana com as transições, em que a linha de cada estado começa no
+        deslocamento numero_estado * largura e cada valor já é o deslocamento do estado destino.
+      - inicial: O deslocamento do estado inicial.
+      - morto: O deslocamento do estado morto, alcançado por toda transição não definida.
+      - finais: Um conjunto com os deslocamentos dos estados finais.
+    """
+    # Numeração dos estados: o estado inicial recebe o número 0 e os demais seguem em ordem
+    nomes = [estadoInicial]
+    for estado in sorted(estados, key=str):
+      if estado != estadoInicial:
+        nomes.append(estado)
+    numeros = {estado: numero for numero, estado in enumerate(nomes)}
+    for (origem, _), destino in transicoes.items():
+      for estado in (origem, destino):
+        if estado not in numeros:
+          numeros[estado] = len(nomes)
+          nomes.append(estado)
+
+    self.nomes = nomes
+    self.simbolos = sorted(alfabeto, key=str)
+    self.classes = {simbolo: classe for classe, simbolo in enumerate(self.simbolos)}
+    self.largura = max(len(self.simbolos), 1)
+    self.morto = len(nomes) * self.largura
+
+    # O estado morto ocupa a última linha e todas as transições não definidas levam a ele
+    delta = [self.morto] * (self.morto + self.largura)
+    for (origem, simbolo), destino in transicoes.items():
+      classe = self.classes.get(simbolo)
+      if classe is None: # Ex.: ('q0', '') do autômato A, que apenas marca q0 como final
+        continue
+      delta[numeros[origem] * self.largura + classe] = numeros[destino] * self.largura
+    self.delta = delta
+    self.inicial = 0
+    self.finais = frozenset(numeros[estado] * self.largura for estado in estadosFinais if estado in numeros)
+
+  def aceita(self, cadeia):
+    """
+    Executa a tabela sobre a cadeia fornecida, encerrando assim que o estado morto é alcançado.
+
+    Parâmetros:
+      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
+
+    Retorna:
+      - True se a cadeia for aceita, False caso contrário.
+    """
+    classes = self.classes
+    delta = self.delta
+    morto = self.morto
+    estado = self.inicial
+    for simbolo in cadeia:
+      classe = classes.get(simbolo)
+      if classe is None: # Símbolo fora do alfabeto
+        return False
+      estado = delta[estado + classe]
+      if estado == morto:
+        return False
+    return estado in self.finais
+
+  def avancar(self, estado, cadeia):
+    """
+    Executa a tabela sobre a cadeia fornecida a partir de um estado qualquer, permitindo que uma
+    mesma palavra seja lida em vários pedaços.
+
+    Parâmetros:
+      - estado: O deslocamento do estado de partida.
+      - cadeia: Uma string contendo os próximos símbolos a serem lidos.
+
+    Retorna:
+      - O deslocamento do estado alcançado (o estado morto se algum símbolo estiver fora do alfabeto).
+    """
+    classes = self.classes
+    delta = self.delta
+    morto = self.morto
+    for simbolo in cadeia:
+      classe = classes.get(simbolo)
+      if classe is None:
+        return morto
+      estado = delta[estado + classe]
+      if estado == morto:
+        return morto
+    return estado
+
+  def nome(self, estado):
+    """
+    Obtém o estado original correspondente a um deslocamento da tabela.
+
+    Parâmetros:
+      - estado: O deslocamento do estado na tabela.
+
+    Retorna:
+      - O estado correspondente do autômato (None para o estado morto).
+    """
+    numero = estado // self.largura
+    return self.nomes[numero] if numero < len(self.nomes) else None
+
+  def proximo(self, numero, classe):
+    """
+    Consulta a transição de um estado na tabela.
+
+    Parâmetros:
+      - numero: O número do estado de origem.
+      - classe: A classe do símbolo lido.
+
+    Retorna:
+      - O número do estado destino (o estado morto é o número len(nomes)).
+    """
+    return self.delta[numero * self.largura + classe] // self.largura
+
+
+class Automato:
+  """
+  Classe Automato responsável por instanciar automatos que reconheçam a cadeia informada.
+  """
+  def __init__(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais): # Método para inicialização da classe
+    """
+    Inicializa a classe Automato.
+
+    Atributos:
+      - estados: Uma lista de estados possíveis para o autômato.
+      - alfabeto: Uma lista de símbolos que formam o alfabeto reconhecido pelo autômato.
+      - transicoes: Um dicionário que define as transições permitidas entre os estados do autômato.
+      - estadoInicial: O estado inicial do autômato.
+      - estadosFinais: Uma lista de estados finais do autômato, representando a aceitação da palavra.
+    """
+    self._estados = estados
+    self._alfabeto = alfabeto
+    self._transicoes = transicoes
+    self._estadoInicial = estadoInicial
+    self._estadosFinais = estadosFinais
+    self._tabela = None
+    self._tabela_lote = None
+
+  def _novo(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais):
+    """
+    Instancia um novo autômato da mesma classe, para as operações que constroem autômatos a partir deste.
+
+    Retorna:
+      - O novo autômato.
+    """
+    return type(self)(estados, alfabeto, transicoes, estadoInicial, estadosFinais)
+
+  def compilar_tabela(self):
+    """
+    Compila o autômato em uma tabela densa, reaproveitando a tabela já compilada nas chamadas seguintes.
+
+    Retorna:
+      - A TabelaCompilada correspondente ao autômato.
+    """
+    if self._tabela is None:
+      self._tabela = TabelaCompilada(self._estados, self._alfabeto, self._transicoes,
+                                     self._estadoInicial, self._estadosFinais)
+    return self._tabela
+
+  def verificar_cadeia(self, cadeia):
+    """
+    Verifica se a cadeia fornecida é reconhecida pelo autômato.
+
+    Parâmetros:
+      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
+
+    Retorna:
+      - True se a cadeia for aceita pelo autômato, False caso contrário.
+    """
+    tabela = self._tabela or self.compilar_tabela()
+    return tabela.aceita(cadeia)
+
+  def ocorrencia_posicao(self, texto):
+    """
+    Verifica as ocorrências e as posições das palavras aceitas pelo autômato em um texto.
+
+    Parâmetros:
+      - texto: Uma string contendo o texto em que serão buscadas as ocorrências.
+
+    Retorna:
+      - Um tuple contendo o número de ocorrências encontradas e uma lista com as posições das ocorrências.
+    """
+    posicoesTexto = [indice for indice, _ in self.ocorrencias_fluxo(varredura.fatiar(texto))]
+    return len(posicoesTexto), posicoesTexto
+
+  def ocorrencias_fluxo(self, fluxo):
+    """
+    Procura as ocorrências das palavras aceitas pelo autômato em um texto lido em pedaços, sem
+    guardar o texto em memória. Funciona com qualquer tabela que compilar_tabela devolva, inclusive
+    as preguiçosas.
+
+    Parâmetros:
+      - fluxo: Um iterável de strings com os pedaços do texto, como varredura.ler_blocos(arquivo).
+
+    Retorna:
+      - Um gerador de tuples contendo a posição da palavra (a mesma de ocorrencia_posicao) e a
+        posição do seu primeiro caractere no texto.
+    """
+    return ((indice, posicao) for indice, posicao, _ in varredura.varrer(self.compilar_tabela(), fluxo))
+
+  def instrumentar(self, instrumentacao=None):
+    """
+    Ativa a instrumentação da tabela (visitas aos estados, uso das transições e motivos de rejeição)
+    e do tempo de cada chamada de verificar_cadeia, classificar, ocorrencia_posicao e ocorrencias_fluxo.
+    As verificações em lote e em paralelo não são instrumentadas.
+
+    Parâmetros:
+      - instrumentacao: A instrumentacao.Instrumentacao que recebe as medições (por padrão, uma nova).
+
+    Retorna:
+      - A Instrumentacao utilizada.
+    """
+    import instrumentacao as modulo
+    if instrumentacao is None:
+      instrumentacao = modulo.Instrumentacao()
+    modulo.instrumentar_automato(self, instrumentacao)
+    return instrumentacao
+
+  def desinstrumentar(self):
+    """
+    Desativa a instrumentação, voltando a executar a tabela original sem nenhum custo adicional.
+    """
+    for nome in ('verificar_cadeia', 'classificar', 'ocorrencia_posicao', 'ocorrencias_fluxo'):
+      self.__dict__.pop(nome, None)
+    self._tabela = getattr(self._tabela, 'original', self._tabela)
+
+  def verificar_cadeia_paralela(self, cadeia, processos=None):
+    """
+    Verifica uma cadeia muito longa dividindo-a entre vários processos (ver paralelo.executar).
+
+    Parâmetros:
+      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
+      - processos: A quantidade de processos (por padrão, a quantidade de processadores).
+
+    Retorna:
+      - True se a cadeia for aceita pelo autômato, False caso contrário.
+    """
+    import paralelo
+    tabela = self.compilar_tabela()
+    estado, _ = paralelo.executar(tabela, cadeia, processos)
+    return estado * tabela.largura in tabela.finais
+
+  def percorrer_paralelo(self, cadeia, processos=None):
+    """
+    Obtém o estado do autômato após cada símbolo de uma cadeia muito longa, dividindo-a entre vários processos.
+
+    Parâmetros:
+      - cadeia: Uma string contendo a cadeia de símbolos.
+      - processos: A quantidade de processos (por padrão, a quantidade de processadores).
+
+    Retorna:
+      - Um array com o número do estado após cada símbolo, em que o número i corresponde ao
+        estado compilar_tabela().nomes[i] e o número len(nomes) ao estado morto. O tipo do array
+        é o menor capaz de guardar esses números (ver paralelo.tipo_estados).
+    """
+    import paralelo
+    _, estados = paralelo.executar(self.compilar_tabela(), cadeia, processos, estados=True)
+    return estados
+
+  def verificar_lote(self, cadeias):
+    """
+    Verifica um lote de cadeias de uma só vez, com o mesmo resultado de verificar_cadeia para cada uma.
+    Requer o NumPy.
+
+    Parâmetros:
+      - cadeias: Uma sequência de strings a serem verificadas.
+
+    Retorna:
+      - Um array booleano do NumPy com o resultado da verificação de cada cadeia.
+    """
+    import lote
+    return lote.verificar_lote(self._compilar_lote(), cadeias)
+
+  def verificar_lote_codificado(self, codigos, comprimentos):
+    """
+    Verifica um lote de cadeias já codificadas, evitando o custo de criar, concatenar e codificar uma
+    string para cada cadeia (ver lote.verificar_codificado). Requer o NumPy.
+
+    Parâmetros:
+      - codigos: Os códigos (pontos de código Unicode) dos símbolos de todas as cadeias concatenadas,
+        como um array inteiro do NumPy ou como bytes (um código de 0 a 255 por byte, como em latin-1).
+      - comprimentos: A quantidade de símbolos de cada cadeia.
+
+    Retorna:
+      - Um array booleano do NumPy com o resultado da verificação de cada cadeia.
+    """
+    import lote
+    return lote.verificar_codificado(self._compilar_lote(), codigos, comprimentos)
+
+  def _compilar_lote(self):
+    """
+    Cria a lote.TabelaLote do autômato, reaproveitando-a nas chamadas seguintes.
+    """
+    if self._tabela_lote is None:
+      import lote
+      self._tabela_lote = lote.TabelaLote(self.compilar_tabela())
+    return self._tabela_lote
+
+  def minimizar(self):
+    """
+    Minimiza o autômato pelo algoritmo de Hopcroft, removendo os estados inalcançáveis e
+    agrupando os estados equivalentes.
+
+    Retorna:
+      - Um tuple contendo o autômato mínimo equivalente, com estados 'q0', 'q1', ... (sendo 'q0' o
+        inicial), e um dicionário que associa cada estado original ao novo estado correspondente
+        (None para estados inalcançáveis ou que não levam a nenhum estado final).
+    """
+    tabela = self.compilar_tabela()
+    novos, transicoes, representantes, bloco_de = quociente(tabela)
+    mapeamento = {nome: novos[bloco_de[estado]] if bloco_de[estado] is not None else None
+                  for estado, nome in enumerate(tabela.nomes)}
+    finais = {novos[bloco] for bloco, estado in enumerate(representantes)
+              if estado is not None and estado * tabela.largura in tabela.finais}
+
+    minimo = self._novo(set(novos), set(self._alfabeto), transicoes, novos[0], finais)
+    return minimo, mapeamento
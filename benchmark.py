@@ -0,0 +1,351 @@
+"""
+O seguinte algoritmo tem como objetivo medir o desempenho dos mecanismos de verificação das três
+questões sobre cargas sintéticas reproduzíveis (geradas a partir de uma semente): cadeias aleatórias
+sobre os alfabetos da primeira questão, textos com ocorrências plantadas da palavra 'computador' para
+a segunda e longas sequências de moedas para a terceira. Para cada mecanismo são informados a vazão
+(símbolos por segundo), os percentis de latência por chamada e o pico de memória; os resultados podem
+ser gravados em JSON como linha de base e comparados com uma execução posterior, indicando regressões.
+
+A vazão conta os símbolos submetidos (o tamanho das cargas), e não os símbolos efetivamente lidos:
+verificar_cadeia encerra assim que alcança o estado morto, então um autômato que rejeita a maioria
+das cadeias logo nos primeiros símbolos (como o A) apresenta uma vazão muito maior que a de uma leitura
+completa. A vazão serve para comparar o mesmo cenário entre execuções, não cenários diferentes.
+
+Uso: python benchmark.py [--escala N] [--semente S] [--filtro TEXTO] [--salvar base.json] [--comparar base.json]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import primeira_questao
+import segunda_questao
+import terceira_questao
+from dicionario import Dicionario
+
+SEMENTE = 2023
+# Variação relativa a partir da qual uma métrica é considerada uma regressão
+TOLERANCIA = 0.2
+# Passadas cronometradas por inteiro (a vazão informada é a da passada mediana)
+REPETICOES = 5
+# Quantidade mínima de chamadas medidas para que a latência p99 seja comparada
+MINIMO_P99 = 100
+# Aumento mínimo, em microssegundos, para que a latência p99 seja considerada uma regressão: abaixo
+# disso a variação é dominada pelo ruído do relógio e do sistema
+MINIMO_LATENCIA_US = 5.0
+PALAVRA = 'computador'
+VOCABULARIO = (
+  'o', 'a', 'os', 'as', 'de', 'do', 'da', 'em', 'no', 'na', 'um', 'uma', 'que', 'com', 'para', 'por',
+  'se', 'mais', 'como', 'mundo', 'tecnologia', 'sociedade', 'trabalho', 'dados', 'rede', 'sistema',
+  'programa', 'processo', 'informação', 'máquina', 'pessoas', 'tempo', 'forma', 'área', 'médica',
+  'educação', 'software', 'desenvolvimento', 'ferramenta', 'essencial', 'moderno', 'digital',
+  'revolução', 'cálculos', 'aplicativos', 'professores', 'alunos', 'pesquisa', 'inovação', 'é', 'são',
+)
+# Palavras parecidas com a procurada, que não devem ser contadas
+QUASE = ('computadores', 'computadorizados', 'computa', 'computado', 'microcomputador', 'computação')
+PONTUACOES = ('', '', '', '', ',', '.', ';', ':', '!', '?')
+MOEDAS = ('25', '50', '100')
+
+def cadeias_aleatorias(alfabeto, quantidade, tamanho_maximo, semente=SEMENTE):
+  """
+  Gera cadeias aleatórias sobre um alfabeto.
+
+  Parâmetros:
+    - alfabeto: Os símbolos usados.
+    - quantidade: A quantidade de cadeias.
+    - tamanho_maximo: O tamanho máximo de cada cadeia.
+    - semente: A semente do gerador.
+
+  Retorna:
+    - Uma lista de strings.
+  """
+  gerador = random.Random(semente)
+  simbolos = sorted(alfabeto)
+  return [''.join(gerador.choices(simbolos, k=gerador.randint(0, tamanho_maximo))) for _ in range(quantidade)]
+
+
+def corpus_sintetico(palavras, plantadas, semente=SEMENTE):
+  """
+  Gera um texto parecido com o português, com pontuação, quebras de parágrafo, palavras parecidas
+  com 'computador' e uma quantidade exata de ocorrências da palavra 'computador'.
+
+  Parâmetros:
+    - palavras: A quantidade total de palavras do texto.
+    - plantadas: A quantidade de ocorrências de 'computador' (no máximo palavras).
+    - semente: A semente do gerador.
+
+  Retorna:
+    - Uma string com o texto.
+  """
+  gerador = random.Random(semente)
+  posicoes = set(gerador.sample(range(palavras), plantadas))
+  partes = []
+  for indice in range(palavras):
+    if indice in posicoes:
+      palavra = PALAVRA
+    elif gerador.random() < 0.02:
+      palavra = gerador.choice(QUASE)
+    else:
+      palavra = gerador.choice(VOCABULARIO)
+    partes.append(palavra + gerador.choice(PONTUACOES))
+    partes.append('\n\n' if gerador.random() < 0.01 else ' ')
+  return ''.join(partes)
+
+
+def moedas(quantidade, semente=SEMENTE, invalidas=0.01):
+  """
+  Gera uma sequência de moedas para a Máquina de Moore, com algumas entradas inválidas.
+
+  Parâmetros:
+    - quantidade: A quantidade de moedas.
+    - semente: A semente do gerador.
+    - invalidas: A fração aproximada de entradas inválidas.
+
+  Retorna:
+    - Uma lista de strings.
+  """
+  gerador = random.Random(semente)
+  return [gerador.choice(MOEDAS) if gerador.random() >= invalidas else '5' for _ in range(quantidade)]
+
+
+def percentil(ordenados, fracao):
+  """
+  Obtém um percentil pelo método do posto mais próximo.
+
+  Parâmetros:
+    - ordenados: Uma lista de valores em ordem crescente.
+    - fracao: O percentil desejado, entre 0 e 1.
+
+  Retorna:
+    - O valor correspondente.
+  """
+  posicao = max(0, min(len(ordenados) - 1, int(fracao * len(ordenados) + 0.5) - 1))
+  return ordenados[posicao]
+
+
+def cronometrar(funcao, cargas):
+  """
+  Cronometra uma passada inteira de uma função sobre uma lista de cargas, sem o custo de consultar
+  o relógio a cada chamada.
+
+  Retorna:
+    - A duração da passada, em segundos.
+  """
+  relogio = time.perf_counter_ns
+  inicio = relogio()
+  for carga in cargas:
+    funcao(carga)
+  return (relogio() - inicio) / 1e9
+
+
+def medir(funcao, cargas, simbolos, tempos=None, repeticoes=REPETICOES):
+  """
+  Mede uma função sobre uma lista de cargas em três etapas separadas, para que uma medição não
+  interfira na outra: a vazão, pela mediana de passadas inteiras cronometradas (ver cronometrar);
+  a latência, cronometrando cada chamada em mais uma passada; e o pico de memória, com o rastreamento
+  de memória, que deixa a execução mais lenta.
+
+  Parâmetros:
+    - funcao: A função medida, chamada com cada carga.
+    - cargas: A lista de cargas.
+    - simbolos: A quantidade total de símbolos submetidos em uma passada sobre as cargas.
+    - tempos: As durações das passadas já cronometradas, em segundos (por padrão, são cronometradas
+      repeticoes passadas em seguida).
+    - repeticoes: A quantidade de passadas cronometradas quando tempos não é informado.
+
+  Retorna:
+    - Um dicionário com as métricas da medição.
+  """
+  if tempos is None:
+    tempos = [cronometrar(funcao, cargas) for _ in range(repeticoes)]
+  total = percentil(sorted(tempos), 0.5) # A mediana não é afetada por uma passada atípica, rápida ou lenta
+
+  relogio = time.perf_counter_ns
+
+  latencias = []
+  for carga in cargas:
+    inicio = relogio()
+    funcao(carga)
+    latencias.append(relogio() - inicio)
+
+  tracemalloc.start()
+  try:
+    for carga in cargas:
+      funcao(carga)
+    _, pico = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+
+  latencias.sort()
+  return {
+    'chamadas': len(latencias),
+    'simbolos': simbolos,
+    'segundos': total,
+    'simbolos_por_segundo': simbolos / total if total else float('inf'),
+    'latencia_p50_us': percentil(latencias, 0.50) / 1e3,
+    'latencia_p90_us': percentil(latencias, 0.90) / 1e3,
+    'latencia_p99_us': percentil(latencias, 0.99) / 1e3,
+    'memoria_pico_bytes': pico,
+  }
+
+
+def cenarios(escala=1, semente=SEMENTE):
+  """
+  Monta os cenários medidos, com as cargas proporcionais à escala.
+
+  Parâmetros:
+    - escala: O fator multiplicativo do tamanho das cargas.
+    - semente: A semente dos geradores.
+
+  Retorna:
+    - Uma lista de tuples (nome, função, cargas, quantidade total de símbolos).
+  """
+  lista = []
+
+  # Primeira questão: cadeias aleatórias sobre o alfabeto de cada autômato
+  for letra in 'ABCD':
+    automato = getattr(primeira_questao, 'automato' + letra)
+    cadeias = cadeias_aleatorias(automato._alfabeto, 20000 * escala, 40, semente)
+    lista.append((f'primeira.verificar_cadeia[{letra}]', automato.verificar_cadeia, cadeias, sum(map(len, cadeias))))
+  cadeias = cadeias_aleatorias('abc', 20000 * escala, 40, semente)
+  lista.append(('primeira.classificar[A-D]', primeira_questao.automatos.classificar, cadeias, sum(map(len, cadeias))))
+  try:
+    import numpy # noqa: F401 (verificar_lote requer o NumPy)
+  except ImportError:
+    pass
+  else:
+    lotes = [cadeias[inicio:inicio + 1000] for inicio in range(0, len(cadeias), 1000)]
+    primeira_questao.automatoB.verificar_lote(lotes[0]) # Aquecimento: importação e compilação da tabela
+    lista.append(('primeira.verificar_lote[B]', primeira_questao.automatoB.verificar_lote, lotes, sum(map(len, cadeias))))
+
+  # Segunda questão: textos com ocorrências plantadas
+  textos = [corpus_sintetico(5000 * escala, 50 * escala, semente + indice) for indice in range(20)]
+  lista.append(('segunda.ocorrencia_posicao', segunda_questao.automatoComputador.ocorrencia_posicao,
+                textos, sum(map(len, textos))))
+  dicionario = Dicionario([PALAVRA] + list(QUASE))
+  lista.append(('dicionario.ocorrencias_por_palavra', dicionario.ocorrencias_por_palavra, textos, sum(map(len, textos))))
+
+  # Terceira questão: muitas sequências curtas (uma máquina por sequência) e sequências longas
+  tamanhos = random.Random(semente).choices(range(1, 16), k=20000 * escala)
+  curtas = [moedas(tamanho, semente + indice) for indice, tamanho in enumerate(tamanhos)]
+  lista.append(('terceira.ligar[curtas]', lambda sequencia: terceira_questao.MaquinaRefri().ligar(sequencia),
+                curtas, sum(map(len, curtas))))
+  longas = [moedas(50000 * escala, semente + indice) for indice in range(10)]
+  lista.append(('terceira.ligar[longas]', terceira_questao.MaquinaRefri().ligar, longas, sum(map(len, longas))))
+  lista.append(('terceira.ligar_buffer[longas]', terceira_questao.MaquinaRefri().ligar_buffer, longas, sum(map(len, longas))))
+  lista.append(('terceira.ligar_stream[longas]', lambda sequencia: list(terceira_questao.MaquinaRefri().ligar_stream(sequencia)),
+                longas, sum(map(len, longas))))
+  return lista
+
+
+def executar(escala=1, semente=SEMENTE, filtro=None):
+  """
+  Executa os cenários.
+
+  Parâmetros:
+    - escala: O fator multiplicativo do tamanho das cargas.
+    - semente: A semente dos geradores.
+    - filtro: Se informado, apenas os cenários cujo nome contém esse texto são executados.
+
+  Retorna:
+    - Um dicionário com as informações da execução ('meta') e as métricas de cada cenário ('resultados').
+  """
+  selecionados = [cenario for cenario in cenarios(escala, semente) if filtro is None or filtro in cenario[0]]
+  # As passadas dos cenários são alternadas, de forma que uma oscilação passageira da máquina afeta
+  # uma passada de cada cenário, e não todas as passadas de um mesmo cenário
+  tempos = {nome: [] for nome, _, _, _ in selecionados}
+  for _ in range(REPETICOES):
+    for nome, funcao, cargas, _ in selecionados:
+      tempos[nome].append(cronometrar(funcao, cargas))
+  resultados = {}
+  for nome, funcao, cargas, simbolos in selecionados:
+    resultados[nome] = medir(funcao, cargas, simbolos, tempos[nome])
+  meta = {
+    'escala': escala,
+    'semente': semente,
+    'python': platform.python_version(),
+    'plataforma': platform.platform(),
+    'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+  }
+  return {'meta': meta, 'resultados': resultados}
+
+
+def comparar(atual, base, tolerancia=TOLERANCIA):
+  """
+  Compara uma execução com a linha de base.
+
+  Parâmetros:
+    - atual: O resultado de executar.
+    - base: O resultado de uma execução anterior, gravado como linha de base.
+    - tolerancia: A variação relativa tolerada em cada métrica (a latência p99 também precisa subir
+      pelo menos MINIMO_LATENCIA_US).
+
+  Retorna:
+    - Uma lista de strings descrevendo as regressões (vazia se não houver nenhuma).
+  """
+  if (atual['meta']['escala'], atual['meta']['semente']) != (base['meta']['escala'], base['meta']['semente']):
+    return ['A linha de base foi gerada com outra escala ou semente; as cargas não são comparáveis.']
+  regressoes = []
+  for nome, medida in atual['resultados'].items():
+    anterior = base['resultados'].get(nome)
+    if anterior is None:
+      continue
+    if medida['simbolos_por_segundo'] < anterior['simbolos_por_segundo'] * (1 - tolerancia):
+      regressoes.append(f"{nome}: vazão caiu de {anterior['simbolos_por_segundo']:.0f} para {medida['simbolos_por_segundo']:.0f} símbolos/s")
+    if (medida['chamadas'] >= MINIMO_P99 and medida['latencia_p99_us'] > anterior['latencia_p99_us'] * (1 + tolerancia)
+        and medida['latencia_p99_us'] - anterior['latencia_p99_us'] >= MINIMO_LATENCIA_US):
+      regressoes.append(f"{nome}: latência p99 subiu de {anterior['latencia_p99_us']:.1f} para {medida['latencia_p99_us']:.1f} µs")
+    if medida['memoria_pico_bytes'] > anterior['memoria_pico_bytes'] * (1 + tolerancia):
+      regressoes.append(f"{nome}: pico de memória subiu de {anterior['memoria_pico_bytes']} para {medida['memoria_pico_bytes']} bytes")
+  return regressoes
+
+
+def formatar(resultado):
+  """
+  Formata os resultados como uma tabela de texto.
+  """
+  linhas = [f"{'cenário':<34}{'símbolos/s':>14}{'p50 µs':>10}{'p90 µs':>10}{'p99 µs':>10}{'memória KiB':>13}"]
+  for nome, medida in resultado['resultados'].items():
+    linhas.append(f"{nome:<34}{medida['simbolos_por_segundo']:>14.0f}{medida['latencia_p50_us']:>10.1f}"
+                  f"{medida['latencia_p90_us']:>10.1f}{medida['latencia_p99_us']:>10.1f}"
+                  f"{medida['memoria_pico_bytes'] / 1024:>13.1f}")
+  return '\n'.join(linhas)
+
+
+def main(argumentos=None):
+  """
+  Executa o benchmark pela linha de comando.
+
+  Retorna:
+    - O código de saída do processo: 1 se alguma regressão foi encontrada, 0 caso contrário.
+  """
+  analisador = argparse.ArgumentParser(description='Benchmark dos autômatos e da Máquina de Moore.')
+  analisador.add_argument('--escala', type=int, default=1, help='fator multiplicativo do tamanho das cargas')
+  analisador.add_argument('--semente', type=int, default=SEMENTE, help='semente dos geradores de cargas')
+  analisador.add_argument('--filtro', help='executa apenas os cenários cujo nome contém este texto')
+  analisador.add_argument('--salvar', metavar='ARQUIVO', help='grava os resultados como linha de base em JSON')
+  analisador.add_argument('--comparar', metavar='ARQUIVO', help='compara os resultados com uma linha de base em JSON')
+  analisador.add_argument('--tolerancia', type=float, default=TOLERANCIA, help='variação relativa tolerada em cada métrica')
+  opcoes = analisador.parse_args(argumentos)
+
+  resultado = executar(opcoes.escala, opcoes.semente, opcoes.filtro)
+  print(formatar(resultado))
+  if opcoes.salvar:
+    with open(opcoes.salvar, 'w', encoding='utf-8') as arquivo:
+      json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+  if opcoes.comparar:
+    with open(opcoes.comparar, encoding='utf-8') as arquivo:
+      base = json.load(arquivo)
+    regressoes = comparar(resultado, base, opcoes.tolerancia)
+    for regressao in regressoes:
+      print('REGRESSÃO:', regressao)
+    if regressoes:
+      return 1
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
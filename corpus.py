@@ -0,0 +1,112 @@
+"""
+O seguinte algoritmo tem como objetivo procurar as ocorrências de um autômato em um arquivo grande,
+dividindo-o em trechos que são varridos em paralelo por um conjunto de processos. O arquivo é
+mapeado em memória (mmap) e cada trecho começa logo após um espaço em branco, de forma que nenhuma
+palavra fica dividida entre dois trechos; as posições locais de cada trecho são depois somadas às
+dos trechos anteriores, reproduzindo exatamente o resultado da varredura sequencial.
+"""
+import codecs
+import mmap
+import os
+import re
+
+import varredura
+
+# Arquivos menores que isso (em bytes) são varridos no próprio processo
+MINIMO_PARALELO = 1 << 20
+# Bytes de espaço em branco do ASCII (reconhecidos por str.split), que nunca fazem parte de um caractere UTF-8 maior
+ESPACOS = re.compile(rb'[ \t\n\r\x0b\x0c\x1c-\x1f]')
+
+def dividir(mapa, partes):
+  """
+  Divide o arquivo mapeado em trechos que terminam logo após um espaço em branco.
+
+  Parâmetros:
+    - mapa: O arquivo mapeado em memória.
+    - partes: A quantidade desejada de trechos.
+
+  Retorna:
+    - Uma lista de tuples (início, fim) com as posições, em bytes, de cada trecho.
+  """
+  tamanho = len(mapa)
+  trechos = []
+  inicio = 0
+  for parte in range(1, partes + 1):
+    if inicio >= tamanho:
+      break
+    alvo = max(tamanho * parte // partes, inicio)
+    espaco = ESPACOS.search(mapa, alvo) if parte < partes else None
+    fim = espaco.end() if espaco else tamanho
+    trechos.append((inicio, fim))
+    inicio = fim
+  return trechos
+
+
+def varrer_trecho(caminho, inicio, fim, tabela, pontuacao=varredura.PONTUACAO, tamanho_bloco=1 << 20):
+  """
+  Varre um trecho do arquivo, decodificando-o em UTF-8 aos poucos.
+
+  Parâmetros:
+    - caminho: O caminho do arquivo.
+    - inicio: A posição, em bytes, do início do trecho.
+    - fim: A posição, em bytes, do fim do trecho.
+    - tabela: A TabelaCompilada do autômato que reconhece a palavra.
+    - pontuacao: Os caracteres de pontuação ignorados nas palavras.
+    - tamanho_bloco: A quantidade de bytes decodificados de cada vez.
+
+  Retorna:
+    - Um tuple contendo a quantidade de palavras e de caracteres do trecho e a lista de ocorrências
+      (número da palavra, posição do caractere inicial, estado final), relativas ao início do trecho.
+  """
+  varredor = varredura.Varredor(tabela, pontuacao)
+  decodificador = codecs.getincrementaldecoder('utf-8')()
+  ocorrencias = []
+  with open(caminho, 'rb') as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+    for posicao in range(inicio, fim, tamanho_bloco):
+      pedaco = decodificador.decode(mapa[posicao:min(posicao + tamanho_bloco, fim)])
+      ocorrencias.extend(varredor.alimentar(pedaco))
+  ocorrencias.extend(varredor.alimentar(decodificador.decode(b'', final=True)))
+  ocorrencias.extend(varredor.finalizar())
+  return varredor.palavras, varredor.posicao, ocorrencias
+
+
+def ocorrencias_arquivo(tabela, caminho, processos=None, pontuacao=varredura.PONTUACAO):
+  """
+  Procura as palavras aceitas pela tabela em um arquivo de texto UTF-8, em paralelo.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada do autômato que reconhece a palavra.
+    - caminho: O caminho do arquivo.
+    - processos: A quantidade de processos (por padrão, a quantidade de processadores).
+    - pontuacao: Os caracteres de pontuação ignorados nas palavras.
+
+  Retorna:
+    - Uma lista de tuples (número da palavra, posição do caractere inicial, estado final), a mesma
+      de varredura.varrer sobre o arquivo lido com open(caminho, encoding='utf-8', newline='').
+  """
+  processos = processos or os.cpu_count() or 1
+  tamanho = os.path.getsize(caminho)
+  if tamanho == 0:
+    return []
+  if tamanho < MINIMO_PARALELO: # Iniciar os processos custaria mais que a própria varredura
+    processos = 1
+  with open(caminho, 'rb') as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+    trechos = dividir(mapa, processos)
+
+  argumentos = [(caminho, inicio, fim, tabela, pontuacao) for inicio, fim in trechos]
+  if len(trechos) == 1:
+    resultados = [varrer_trecho(*argumentos[0])]
+  else:
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=len(trechos)) as executor:
+      resultados = list(executor.map(varrer_trecho, *zip(*argumentos)))
+
+  # Costura: as posições de cada trecho são deslocadas pelo total dos trechos anteriores
+  ocorrencias = []
+  palavras = 0
+  caracteres = 0
+  for quantidade, comprimento, locais in resultados:
+    ocorrencias.extend((palavras + indice, caracteres + posicao, estado) for indice, posicao, estado in locais)
+    palavras += quantidade
+    caracteres += comprimento
+  return ocorrencias
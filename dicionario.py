@@ -0,0 +1,155 @@
+"""
+O seguinte algoritmo tem como objetivo reconhecer várias palavras de uma só vez, por meio de um
+único autômato de Aho-Corasick: uma árvore de prefixos das palavras, completada com as transições
+de falha, de forma que o custo de percorrer o texto não cresce com a quantidade de palavras.
+"""
+from collections import deque
+
+import automato
+import corpus
+import varredura
+
+class Dicionario(automato.Automato):
+  """
+  Classe Dicionario responsável por instanciar o autômato de Aho-Corasick de uma lista de palavras.
+  Como Automato, reconhece as cadeias sobre o alfabeto das palavras que terminam com alguma delas.
+  """
+  def __init__(self, palavras):
+    """
+    Inicializa o dicionário, montando a árvore de prefixos e as transições de falha.
+
+    Parâmetros:
+      - palavras: Uma lista com as palavras a serem reconhecidas.
+
+    Atributos:
+      - palavras: A lista de palavras, sem repetições.
+      - saidas: Um dicionário que associa cada estado final às palavras que terminam nele,
+        incluindo as alcançadas pelas transições de falha.
+    """
+    self.palavras = list(dict.fromkeys(palavras))
+    if not all(self.palavras):
+      raise ValueError('O dicionário não aceita a palavra vazia.')
+    alfabeto = set(''.join(self.palavras))
+
+    # Árvore de prefixos: cada nó guarda os filhos e a palavra que termina nele
+    filhos = [{}]
+    chaves = [None]
+    for palavra in self.palavras:
+      no = 0
+      for simbolo in palavra:
+        if simbolo not in filhos[no]:
+          filhos[no][simbolo] = len(filhos)
+          filhos.append({})
+          chaves.append(None)
+        no = filhos[no][simbolo]
+      chaves[no] = palavra
+
+    # Transições de falha em largura: um nó herda as transições ausentes do nó de falha
+    nomes = ['q' + str(no) for no in range(len(filhos))]
+    falha = [0] * len(filhos)
+    saidas = [()] * len(filhos)
+    proximos = [None] * len(filhos)
+    proximos[0] = {simbolo: filhos[0].get(simbolo, 0) for simbolo in alfabeto}
+    fila = deque(filhos[0].values())
+    while fila:
+      no = fila.popleft()
+      saidas[no] = ((chaves[no],) if chaves[no] else ()) + saidas[falha[no]]
+      proximos[no] = dict(proximos[falha[no]])
+      for simbolo, filho in filhos[no].items():
+        falha[filho] = proximos[falha[no]][simbolo]
+        proximos[no][simbolo] = filho
+        fila.append(filho)
+
+    transicoes = {(nomes[no], simbolo): nomes[destino]
+                  for no in range(len(filhos)) for simbolo, destino in proximos[no].items()}
+    finais = {nomes[no] for no in range(len(filhos)) if saidas[no]}
+    super().__init__(set(nomes), alfabeto, transicoes, nomes[0], finais)
+    self.saidas = {nomes[no]: saidas[no] for no in range(len(filhos)) if saidas[no]}
+
+    # A árvore sem as transições de falha reconhece exatamente as palavras
+    ramos = {(nomes[no], simbolo): nomes[filho] for no in range(len(filhos)) for simbolo, filho in filhos[no].items()}
+    self._chaves = {nomes[no]: chaves[no] for no in range(len(filhos)) if chaves[no]}
+    self._arvore = automato.Automato(set(nomes), alfabeto, ramos, nomes[0], set(self._chaves))
+
+  def _novo(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais):
+    """
+    Os autômatos construídos a partir do dicionário (como o mínimo) são autômatos comuns.
+    """
+    return automato.Automato(estados, alfabeto, transicoes, estadoInicial, estadosFinais)
+
+  def ocorrencias_por_palavra_fluxo(self, fluxo):
+    """
+    Procura, em uma única passada, as palavras do texto que são iguais a alguma palavra do dicionário.
+    (Os métodos herdados ocorrencia_posicao e ocorrencias_fluxo procuram as palavras aceitas pelo
+    autômato, ou seja, as que terminam com alguma palavra do dicionário, sem separá-las por palavra.)
+
+    Parâmetros:
+      - fluxo: Um iterável de strings com os pedaços do texto, como varredura.ler_blocos(arquivo).
+
+    Retorna:
+      - Um gerador de tuples contendo a palavra do dicionário, a posição da palavra no texto (a mesma
+        de ocorrencia_posicao da segunda questão) e a posição do seu primeiro caractere no texto.
+    """
+    for indice, posicao, estado in varredura.varrer(self._arvore.compilar_tabela(), fluxo):
+      yield self._chaves[estado], indice, posicao
+
+  def ocorrencias_por_palavra(self, texto):
+    """
+    Verifica as ocorrências e as posições de cada palavra do dicionário em um texto.
+
+    Parâmetros:
+      - texto: Uma string contendo o texto em que serão buscadas as ocorrências.
+
+    Retorna:
+      - Um dicionário que associa cada palavra a um tuple contendo o número de ocorrências
+        encontradas e uma lista com as posições das ocorrências.
+    """
+    posicoes = {palavra: [] for palavra in self.palavras}
+    for palavra, indice, _ in self.ocorrencias_por_palavra_fluxo(varredura.fatiar(texto)):
+      posicoes[palavra].append(indice)
+    return {palavra: (len(lista), lista) for palavra, lista in posicoes.items()}
+
+  def ocorrencias_por_palavra_arquivo(self, caminho, processos=None):
+    """
+    Verifica as ocorrências e as posições de cada palavra do dicionário em um arquivo de texto UTF-8,
+    dividindo a varredura entre vários processos.
+
+    Parâmetros:
+      - caminho: O caminho do arquivo.
+      - processos: A quantidade de processos (por padrão, a quantidade de processadores).
+
+    Retorna:
+      - O mesmo dicionário de ocorrencias_por_palavra sobre o conteúdo do arquivo.
+    """
+    posicoes = {palavra: [] for palavra in self.palavras}
+    for indice, _, estado in corpus.ocorrencias_arquivo(self._arvore.compilar_tabela(), caminho, processos):
+      posicoes[self._chaves[estado]].append(indice)
+    return {palavra: (len(lista), lista) for palavra, lista in posicoes.items()}
+
+  def buscar_fluxo(self, fluxo):
+    """
+    Procura as palavras do dicionário em qualquer ponto do texto, inclusive dentro de outras palavras
+    (por exemplo, 'computador' em 'computadores').
+
+    Parâmetros:
+      - fluxo: Um iterável de strings com os pedaços do texto.
+
+    Retorna:
+      - Um gerador de tuples contendo a palavra do dicionário e a posição do seu primeiro caractere no texto.
+    """
+    tabela = self.compilar_tabela()
+    saidas = {numero * tabela.largura: self.saidas[nome] for numero, nome in enumerate(tabela.nomes) if nome in self.saidas}
+    classes = tabela.classes
+    delta = tabela.delta
+    inicial = tabela.inicial
+    estado = inicial
+    posicao = 0
+    for pedaco in fluxo:
+      for simbolo in pedaco:
+        posicao += 1
+        classe = classes.get(simbolo)
+        # Um símbolo fora do alfabeto não pertence a nenhuma palavra: volta ao estado inicial
+        estado = inicial if classe is None else delta[estado + classe]
+        if estado in saidas:
+          for palavra in saidas[estado]:
+            yield palavra, posicao - len(palavra)
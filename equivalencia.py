@@ -0,0 +1,175 @@
+"""
+O seguinte algoritmo tem como objetivo decidir se dois autômatos reconhecem a mesma linguagem (ou se a
+linguagem de um está contida na do outro) sem enumerar cadeias. Pelo algoritmo de Hopcroft e Karp, os
+pares de estados alcançados juntos pelas mesmas cadeias são unidos em uma estrutura union-find; um par
+cujos estados já estão na mesma classe não precisa ser explorado de novo, o que torna a verificação
+quase linear no número de estados. Quando os autômatos diferem, uma busca em largura sobre os pares
+de estados devolve o menor contraexemplo.
+"""
+from collections import deque
+
+class _FinaisUniao:
+  """
+  Classe _FinaisUniao responsável por indicar se um par de estados é final na união de dois autômatos.
+  """
+  def __init__(self, tabela_a, tabela_b):
+    """
+    Inicializa o conjunto de finais a partir das tabelas dos dois autômatos.
+    """
+    self.tabela_a = tabela_a
+    self.tabela_b = tabela_b
+
+  def __contains__(self, par):
+    """
+    Retorna True se algum dos estados do par é final no seu autômato.
+    """
+    return par[0] in self.tabela_a.finais or par[1] in self.tabela_b.finais
+
+
+class _TabelaUniao:
+  """
+  Classe _TabelaUniao responsável por executar a união de dois autômatos, construída sob demanda, em
+  que cada estado é um par (estado de A, estado de B).
+  """
+  def __init__(self, tabela_a, tabela_b):
+    """
+    Inicializa a tabela da união.
+
+    Atributos:
+      - inicial: O par dos estados iniciais.
+      - finais: Um objeto que indica, pelo operador in, se um par é final.
+    """
+    self.tabela_a = tabela_a
+    self.tabela_b = tabela_b
+    self.inicial = (tabela_a.inicial, tabela_b.inicial)
+    self.finais = _FinaisUniao(tabela_a, tabela_b)
+
+  def avancar(self, estado, cadeia):
+    """
+    Executa os dois autômatos sobre a cadeia a partir do par de estados fornecido.
+    """
+    return (self.tabela_a.avancar(estado[0], cadeia), self.tabela_b.avancar(estado[1], cadeia))
+
+
+def _simbolos(a, b):
+  """
+  Retorna a lista ordenada dos símbolos dos alfabetos dos dois autômatos.
+  """
+  return sorted(set(a._alfabeto) | set(b._alfabeto), key=str)
+
+
+def _hopcroft_karp(tabela_a, tabela_b, simbolos):
+  """
+  Verifica se as duas tabelas reconhecem a mesma linguagem pelo algoritmo de Hopcroft e Karp.
+
+  Parâmetros:
+    - tabela_a: A tabela do primeiro autômato.
+    - tabela_b: A tabela do segundo autômato.
+    - simbolos: Os símbolos lidos.
+
+  Retorna:
+    - True se as linguagens forem iguais, False caso contrário.
+  """
+  pais = {}
+
+  def raiz(estado):
+    pais.setdefault(estado, estado)
+    topo = estado
+    while pais[topo] != topo:
+      topo = pais[topo]
+    while pais[estado] != topo: # Compressão de caminho
+      pais[estado], estado = topo, pais[estado]
+    return topo
+
+  # Os estados de cada autômato são marcados com 0 ou 1, pois as duas tabelas podem usar os mesmos valores
+  fila = deque([(tabela_a.inicial, tabela_b.inicial)])
+  pais[(0, tabela_a.inicial)] = pais[(1, tabela_b.inicial)] = (0, tabela_a.inicial)
+  while fila:
+    estado_a, estado_b = fila.popleft()
+    if (estado_a in tabela_a.finais) != (estado_b in tabela_b.finais):
+      return False
+    for simbolo in simbolos:
+      destino_a = tabela_a.avancar(estado_a, simbolo)
+      destino_b = tabela_b.avancar(estado_b, simbolo)
+      raiz_a = raiz((0, destino_a))
+      raiz_b = raiz((1, destino_b))
+      if raiz_a != raiz_b:
+        pais[raiz_b] = raiz_a
+        fila.append((destino_a, destino_b))
+  return True
+
+
+def _menor_cadeia(tabela_a, tabela_b, simbolos, difere):
+  """
+  Procura, por busca em largura sobre os pares de estados, a menor cadeia que leva as duas tabelas
+  a um par de estados que satisfaz o critério fornecido.
+
+  Parâmetros:
+    - tabela_a: A tabela do primeiro autômato.
+    - tabela_b: A tabela do segundo autômato.
+    - simbolos: Os símbolos lidos.
+    - difere: Uma função (estado de A, estado de B) -> bool.
+
+  Retorna:
+    - A menor cadeia encontrada, ou None se nenhum par alcançável satisfaz o critério.
+  """
+  inicial = (tabela_a.inicial, tabela_b.inicial)
+  anteriores = {inicial: None} # Par -> (par anterior, símbolo lido)
+  fila = deque([inicial])
+  while fila:
+    par = fila.popleft()
+    if difere(*par):
+      simbolos_lidos = []
+      while anteriores[par] is not None:
+        par, simbolo = anteriores[par]
+        simbolos_lidos.append(simbolo)
+      return ''.join(reversed(simbolos_lidos))
+    for simbolo in simbolos:
+      destino = (tabela_a.avancar(par[0], simbolo), tabela_b.avancar(par[1], simbolo))
+      if destino not in anteriores:
+        anteriores[destino] = (par, simbolo)
+        fila.append(destino)
+  return None
+
+
+def equivalente(a, b):
+  """
+  Verifica se dois autômatos reconhecem a mesma linguagem.
+
+  Parâmetros:
+    - a: O primeiro autômato (qualquer autômato que possua compilar_tabela).
+    - b: O segundo autômato.
+
+  Retorna:
+    - Um tuple contendo True e None se as linguagens forem iguais, ou False e a menor cadeia
+      aceita por apenas um dos autômatos.
+  """
+  tabela_a = a.compilar_tabela()
+  tabela_b = b.compilar_tabela()
+  simbolos = _simbolos(a, b)
+  if _hopcroft_karp(tabela_a, tabela_b, simbolos):
+    return True, None
+  difere = lambda estado_a, estado_b: (estado_a in tabela_a.finais) != (estado_b in tabela_b.finais)
+  return False, _menor_cadeia(tabela_a, tabela_b, simbolos, difere)
+
+
+def contido(a, b):
+  """
+  Verifica se a linguagem do primeiro autômato está contida na do segundo, isto é, se a união das
+  duas linguagens é igual à linguagem do segundo.
+
+  Parâmetros:
+    - a: O primeiro autômato (qualquer autômato que possua compilar_tabela).
+    - b: O segundo autômato.
+
+  Retorna:
+    - Um tuple contendo True e None se toda cadeia aceita por a também for aceita por b, ou False e
+      a menor cadeia aceita por a e rejeitada por b.
+  """
+  tabela_a = a.compilar_tabela()
+  tabela_b = b.compilar_tabela()
+  simbolos = _simbolos(a, b)
+  if _hopcroft_karp(_TabelaUniao(tabela_a, tabela_b), tabela_b, simbolos):
+    return True, None
+  difere = lambda estado_a, estado_b: estado_a in tabela_a.finais and estado_b not in tabela_b.finais
+  return False, _menor_cadeia(tabela_a, tabela_b, simbolos, difere)
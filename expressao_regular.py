@@ -0,0 +1,364 @@
+"""
+O seguinte algoritmo tem como objetivo construir automaticamente o autômato de uma expressão regular,
+no mesmo formato dos autômatos escritos à mão na primeira questão. A expressão é convertida em um
+autômato não determinístico pela construção de Thompson, determinizada pela construção de
+subconjuntos e minimizada; os autômatos já compilados ficam em um cache LRU limitado, indexado pela
+forma normalizada da expressão.
+
+Sintaxe aceita: símbolos, concatenação, união (|), fecho de Kleene (*), uma ou mais vezes (+),
+opcional (?), parênteses e '\\' para usar um caractere especial como símbolo. Uma alternativa vazia,
+como em (a|), representa a cadeia vazia.
+"""
+import functools
+
+from automato import Automato
+
+ESPECIAIS = '|*+?()\\'
+TAMANHO_CACHE = 256
+
+class Analisador:
+  """
+  Classe Analisador responsável por converter o texto de uma expressão regular em uma árvore sintática,
+  em que cada nó é um tuple: ('simbolo', c), ('vazio',), ('uniao', ...), ('concatenacao', ...),
+  ('estrela', x), ('mais', x) ou ('opcional', x).
+  """
+  def __init__(self, regex):
+    """
+    Inicializa o analisador.
+
+    Atributos:
+      - regex: O texto da expressão regular.
+      - posicao: A posição do próximo caractere a ser lido.
+    """
+    self.regex = regex
+    self.posicao = 0
+
+  def analisar(self):
+    """
+    Analisa a expressão inteira.
+
+    Retorna:
+      - A árvore sintática da expressão.
+    """
+    arvore = self._uniao()
+    if self.posicao < len(self.regex):
+      raise ValueError(f'Caractere inesperado {self.regex[self.posicao]!r} na posição {self.posicao} da expressão {self.regex!r}.')
+    return arvore
+
+  def _atual(self):
+    """
+    Retorna o próximo caractere a ser lido, ou None no fim da expressão.
+    """
+    return self.regex[self.posicao] if self.posicao < len(self.regex) else None
+
+  def _uniao(self):
+    """
+    Lê uma união: concatenações separadas por '|'.
+    """
+    alternativas = [self._concatenacao()]
+    while self._atual() == '|':
+      self.posicao += 1
+      alternativas.append(self._concatenacao())
+    return alternativas[0] if len(alternativas) == 1 else ('uniao', *alternativas)
+
+  def _concatenacao(self):
+    """
+    Lê uma concatenação de fatores, que pode ser vazia.
+    """
+    fatores = []
+    while self._atual() is not None and self._atual() not in '|)':
+      fatores.append(self._fator())
+    if not fatores:
+      return ('vazio',)
+    return fatores[0] if len(fatores) == 1 else ('concatenacao', *fatores)
+
+  def _fator(self):
+    """
+    Lê um átomo seguido de zero ou mais operadores unários (*, + e ?).
+    """
+    atomo = self._atomo()
+    operadores = {'*': 'estrela', '+': 'mais', '?': 'opcional'}
+    while self._atual() is not None and self._atual() in operadores:
+      atomo = (operadores[self._atual()], atomo)
+      self.posicao += 1
+    return atomo
+
+  def _atomo(self):
+    """
+    Lê um símbolo, um símbolo escapado ou uma expressão entre parênteses.
+    """
+    caractere = self._atual()
+    if caractere == '(':
+      self.posicao += 1
+      arvore = self._uniao()
+      if self._atual() != ')':
+        raise ValueError(f'Parêntese não fechado na expressão {self.regex!r}.')
+      self.posicao += 1
+      return arvore
+    if caractere == '\\':
+      self.posicao += 1
+      if self._atual() is None:
+        raise ValueError(f'Escape incompleto no fim da expressão {self.regex!r}.')
+    elif caractere in '*+?':
+      raise ValueError(f'Operador {caractere!r} sem operando na posição {self.posicao} da expressão {self.regex!r}.')
+    simbolo = self._atual()
+    self.posicao += 1
+    return ('simbolo', simbolo)
+
+
+def simplificar(arvore):
+  """
+  Simplifica a árvore sintática: agrupa uniões e concatenações aninhadas, remove alternativas
+  repetidas e reduz operadores aplicados sobre outros operadores, como em (a*)* = a*.
+
+  Parâmetros:
+    - arvore: A árvore sintática.
+
+  Retorna:
+    - A árvore simplificada.
+  """
+  tipo = arvore[0]
+  if tipo in ('simbolo', 'vazio'):
+    return arvore
+  filhos = [simplificar(filho) for filho in arvore[1:]]
+  if tipo in ('uniao', 'concatenacao'):
+    planos = []
+    for filho in filhos:
+      planos.extend(filho[1:] if filho[0] == tipo else [filho])
+    if tipo == 'concatenacao':
+      planos = [filho for filho in planos if filho != ('vazio',)] or [('vazio',)]
+    else:
+      planos = list(dict.fromkeys(planos))
+    return planos[0] if len(planos) == 1 else (tipo, *planos)
+  filho = filhos[0]
+  if filho == ('vazio',):
+    return filho
+  if filho[0] in ('estrela', 'mais', 'opcional'):
+    if tipo == filho[0]:
+      return filho
+    return ('estrela', filho[1])
+  return (tipo, filho)
+
+
+def escrever(arvore):
+  """
+  Escreve a árvore sintática como texto, com o mínimo de parênteses.
+
+  Parâmetros:
+    - arvore: A árvore sintática.
+
+  Retorna:
+    - O texto da expressão normalizada.
+  """
+  tipo = arvore[0]
+  if tipo == 'simbolo':
+    return '\\' + arvore[1] if arvore[1] in ESPECIAIS else arvore[1]
+  if tipo == 'vazio':
+    return '()'
+  if tipo == 'uniao':
+    return '|'.join(escrever(filho) for filho in arvore[1:])
+  if tipo == 'concatenacao':
+    return ''.join(f'({escrever(filho)})' if filho[0] == 'uniao' else escrever(filho) for filho in arvore[1:])
+  filho = arvore[1]
+  texto = escrever(filho)
+  if filho[0] in ('uniao', 'concatenacao'):
+    texto = f'({texto})'
+  return texto + {'estrela': '*', 'mais': '+', 'opcional': '?'}[tipo]
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE)
+def normalizar(regex):
+  """
+  Normaliza uma expressão regular, de forma que expressões escritas de formas diferentes, como
+  '((a)b*)' e 'ab*', compartilhem a mesma entrada no cache.
+
+  Parâmetros:
+    - regex: O texto da expressão regular.
+
+  Retorna:
+    - O texto da expressão normalizada.
+  """
+  return escrever(simplificar(Analisador(regex).analisar()))
+
+
+class AFN:
+  """
+  Classe AFN responsável por representar um autômato finito não determinístico com transições em vazio,
+  em que os estados são números inteiros.
+  """
+  def __init__(self):
+    """
+    Inicializa um AFN sem estados.
+
+    Atributos:
+      - transicoes: Uma lista que associa cada estado a um dicionário símbolo -> lista de destinos.
+      - vazias: Uma lista que associa cada estado à lista de destinos das transições em vazio.
+      - inicial: O estado inicial.
+      - final: O único estado final.
+      - alfabeto: O conjunto de símbolos usados nas transições.
+    """
+    self.transicoes = []
+    self.vazias = []
+    self.inicial = None
+    self.final = None
+    self.alfabeto = set()
+
+  def novo_estado(self):
+    """
+    Acrescenta um estado ao AFN.
+
+    Retorna:
+      - O número do novo estado.
+    """
+    self.transicoes.append({})
+    self.vazias.append([])
+    return len(self.vazias) - 1
+
+  def fecho(self, estados):
+    """
+    Calcula o fecho em vazio de um conjunto de estados.
+
+    Parâmetros:
+      - estados: Um iterável de estados.
+
+    Retorna:
+      - Um frozenset com os estados alcançáveis por transições em vazio, incluindo os fornecidos.
+    """
+    fecho = set(estados)
+    pilha = list(fecho)
+    while pilha:
+      for destino in self.vazias[pilha.pop()]:
+        if destino not in fecho:
+          fecho.add(destino)
+          pilha.append(destino)
+    return frozenset(fecho)
+
+  def mover(self, estados, simbolo):
+    """
+    Calcula os estados alcançados a partir de um conjunto de estados pela leitura de um símbolo,
+    já com o fecho em vazio.
+
+    Parâmetros:
+      - estados: Um conjunto de estados.
+      - simbolo: O símbolo lido.
+
+    Retorna:
+      - Um frozenset com os estados alcançados.
+    """
+    destinos = []
+    for estado in estados:
+      destinos.extend(self.transicoes[estado].get(simbolo, ()))
+    return self.fecho(destinos)
+
+
+def thompson(arvore):
+  """
+  Constrói o AFN de uma árvore sintática pela construção de Thompson.
+
+  Parâmetros:
+    - arvore: A árvore sintática.
+
+  Retorna:
+    - O AFN correspondente.
+  """
+  afn = AFN()
+
+  def construir(no):
+    inicio = afn.novo_estado()
+    fim = afn.novo_estado()
+    tipo = no[0]
+    if tipo == 'simbolo':
+      afn.transicoes[inicio].setdefault(no[1], []).append(fim)
+      afn.alfabeto.add(no[1])
+    elif tipo == 'vazio':
+      afn.vazias[inicio].append(fim)
+    elif tipo == 'uniao':
+      for filho in no[1:]:
+        entrada, saida = construir(filho)
+        afn.vazias[inicio].append(entrada)
+        afn.vazias[saida].append(fim)
+    elif tipo == 'concatenacao':
+      anterior = inicio
+      for filho in no[1:]:
+        entrada, saida = construir(filho)
+        afn.vazias[anterior].append(entrada)
+        anterior = saida
+      afn.vazias[anterior].append(fim)
+    else:
+      entrada, saida = construir(no[1])
+      afn.vazias[inicio].append(entrada)
+      afn.vazias[saida].append(fim)
+      if tipo in ('estrela', 'opcional'):
+        afn.vazias[inicio].append(fim)
+      if tipo in ('estrela', 'mais'):
+        afn.vazias[saida].append(entrada)
+    return inicio, fim
+
+  afn.inicial, afn.final = construir(arvore)
+  return afn
+
+
+def subconjuntos(afn, alfabeto):
+  """
+  Determiniza o AFN pela construção de subconjuntos, considerando apenas os conjuntos alcançáveis.
+
+  Parâmetros:
+    - afn: O AFN.
+    - alfabeto: O alfabeto do autômato resultante.
+
+  Retorna:
+    - Um Automato equivalente ao AFN, com estados 'q0', 'q1', ... (o conjunto vazio é omitido,
+      ficando as transições para ele indefinidas, como nos autômatos da primeira questão).
+  """
+  inicial = afn.fecho([afn.inicial])
+  nomes = {inicial: 'q0'}
+  pendentes = [inicial]
+  transicoes = {}
+  simbolos = sorted(alfabeto)
+  while pendentes:
+    conjunto = pendentes.pop()
+    for simbolo in simbolos:
+      destino = afn.mover(conjunto, simbolo)
+      if not destino:
+        continue
+      if destino not in nomes:
+        nomes[destino] = 'q' + str(len(nomes))
+        pendentes.append(destino)
+      transicoes[(nomes[conjunto], simbolo)] = nomes[destino]
+  finais = {nome for conjunto, nome in nomes.items() if afn.final in conjunto}
+  return Automato(set(nomes.values()), set(alfabeto), transicoes, 'q0', finais)
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE)
+def _compilar_normalizada(normalizada, alfabeto):
+  """
+  Compila uma expressão já normalizada; é a função cujo resultado fica no cache.
+  """
+  arvore = Analisador(normalizada).analisar()
+  afn = thompson(arvore)
+  minimo, _ = subconjuntos(afn, afn.alfabeto | alfabeto).minimizar()
+  return minimo
+
+
+def compilar(regex, alfabeto=()):
+  """
+  Compila uma expressão regular em um Automato mínimo. Expressões já compiladas (após a
+  normalização) são devolvidas do cache sem nova construção.
+
+  Parâmetros:
+    - regex: O texto da expressão regular.
+    - alfabeto: Símbolos a serem incluídos no alfabeto além dos usados na expressão (por exemplo,
+      para comparar o resultado com um autômato escrito à mão).
+
+  Retorna:
+    - O Automato mínimo da expressão. O mesmo objeto é compartilhado entre as chamadas, e não deve ser alterado.
+  """
+  return _compilar_normalizada(normalizar(regex), frozenset(alfabeto))
+
+
+def limpar_cache():
+  """
+  Esvazia o cache de autômatos compilados.
+  """
+  normalizar.cache_clear()
+  _compilar_normalizada.cache_clear()
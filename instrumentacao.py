@@ -0,0 +1,335 @@
+"""
+O seguinte algoritmo tem como objetivo observar a execução de autômatos e Máquinas de Moore: quantas
+vezes cada estado é visitado, quantas vezes cada transição é usada, por que as cadeias são rejeitadas
+e quanto tempo cada chamada leva. A instrumentação é opcional e é ativada por objeto: os métodos
+instrumentados são atribuídos à própria instância, sobrepondo os da classe, de forma que os objetos
+não instrumentados executam exatamente o mesmo código de antes, sem nenhum custo adicional.
+"""
+import json
+import time
+from collections import Counter
+
+# Motivos de rejeição
+FORA_DO_ALFABETO = 'simbolo_fora_do_alfabeto'
+TRANSICAO_INDEFINIDA = 'transicao_indefinida'
+ESTADO_NAO_FINAL = 'estado_nao_final'
+ENTRADA_INVALIDA = 'entrada_invalida'
+
+class Instrumentacao:
+  """
+  Classe Instrumentacao responsável por acumular as medições de um ou mais objetos instrumentados
+  que compartilham a mesma tabela.
+  """
+  def __init__(self):
+    """
+    Inicializa a instrumentação sem medições.
+
+    Atributos:
+      - visitas: Um Counter com a quantidade de visitas de cada estado da tabela.
+      - transicoes: Um Counter com a quantidade de usos de cada transição (origem, símbolo, destino).
+      - rejeicoes: Um Counter com a quantidade de rejeições por (motivo, estado, símbolo), em que o
+        símbolo é None quando a cadeia termina em um estado não final.
+      - chamadas: Um dicionário que associa o nome de cada método à quantidade de chamadas, ao tempo
+        total e ao tempo máximo, em nanossegundos.
+      - tabela: A tabela do objeto instrumentado, usada para obter os nomes dos estados.
+    """
+    self.visitas = Counter()
+    self.transicoes = Counter()
+    self.rejeicoes = Counter()
+    self.chamadas = {}
+    self.tabela = None
+
+  def registrar_chamada(self, metodo, duracao):
+    """
+    Registra a duração, em nanossegundos, de uma chamada de um método.
+    """
+    medida = self.chamadas.get(metodo)
+    if medida is None:
+      medida = self.chamadas[metodo] = [0, 0, 0]
+    medida[0] += 1
+    medida[1] += duracao
+    if duracao > medida[2]:
+      medida[2] = duracao
+
+  def limpar(self):
+    """
+    Descarta as medições acumuladas.
+    """
+    self.visitas.clear()
+    self.transicoes.clear()
+    self.rejeicoes.clear()
+    self.chamadas.clear()
+
+  def _nome(self, estado):
+    """
+    Obtém o nome de um estado da tabela como texto.
+    """
+    return str(self.tabela.nome(estado))
+
+  def para_dict(self):
+    """
+    Converte as medições para tipos simples, com os estados identificados pelos seus nomes.
+
+    Retorna:
+      - Um dicionário com as chaves 'visitas', 'transicoes', 'rejeicoes' e 'chamadas'.
+    """
+    return {
+      'visitas': {self._nome(estado): quantidade for estado, quantidade in self.visitas.most_common()},
+      'transicoes': [{'origem': self._nome(origem), 'simbolo': simbolo, 'destino': self._nome(destino), 'usos': quantidade}
+                     for (origem, simbolo, destino), quantidade in self.transicoes.most_common()],
+      'rejeicoes': [{'motivo': motivo, 'estado': self._nome(estado), 'simbolo': simbolo, 'quantidade': quantidade}
+                    for (motivo, estado, simbolo), quantidade in self.rejeicoes.most_common()],
+      'chamadas': {metodo: {'quantidade': quantidade, 'total_ns': total, 'media_ns': total / quantidade, 'maximo_ns': maximo}
+                   for metodo, (quantidade, total, maximo) in self.chamadas.items()},
+    }
+
+  def para_json(self, **opcoes):
+    """
+    Exporta as medições em JSON (ver para_dict); as opções são repassadas para json.dumps.
+    """
+    return json.dumps(self.para_dict(), ensure_ascii=False, **opcoes)
+
+  def para_dot(self, titulo='automato'):
+    """
+    Exporta um mapa de calor no formato DOT do Graphviz: a cor de cada estado varia do azul (pouco
+    visitado) ao vermelho (mais visitado), e a cor e a espessura de cada transição seguem o seu uso.
+
+    Parâmetros:
+      - titulo: O nome do grafo.
+
+    Retorna:
+      - Uma string com o grafo.
+    """
+    def aspas(texto):
+      return '"' + str(texto).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+    def cor(proporcao):
+      return aspas(f'{0.66 * (1 - proporcao):.3f} 0.8 1.0')
+
+    estados = list(self.visitas)
+    for origem, _, destino in self.transicoes:
+      estados.extend((origem, destino))
+    if hasattr(self.tabela, 'nomes'): # Tabelas compiladas: inclui os estados nunca visitados
+      estados.extend(range(0, self.tabela.morto, self.tabela.largura))
+    maximo_visitas = max(self.visitas.values(), default=0) or 1
+    maximo_usos = max(self.transicoes.values(), default=0) or 1
+
+    linhas = [f'digraph {aspas(titulo)} {{', '  rankdir=LR;', '  node [style=filled];']
+    for estado in dict.fromkeys(estados):
+      forma = 'doublecircle' if estado in self.tabela.finais else 'circle'
+      visitas = self.visitas[estado]
+      linhas.append(f'  {aspas(self._nome(estado))} [shape={forma}, fillcolor={cor(visitas / maximo_visitas)}, '
+                    f'xlabel={aspas(visitas)}];')
+    for (origem, simbolo, destino), usos in self.transicoes.most_common():
+      proporcao = usos / maximo_usos
+      linhas.append(f'  {aspas(self._nome(origem))} -> {aspas(self._nome(destino))} [label={aspas(f"{simbolo} ({usos})")}, '
+                    f'color={cor(proporcao)}, penwidth={1 + 4 * proporcao:.2f}];')
+    linhas.append('}')
+    return '\n'.join(linhas)
+
+
+class TabelaInstrumentada:
+  """
+  Classe TabelaInstrumentada responsável por envolver a tabela de um autômato instrumentado: aceita e
+  avancar percorrem a tabela original um símbolo por vez e registram as medições, enquanto os demais
+  atributos são os da própria tabela original. Assim, todos os métodos que executam a tabela por
+  aceita ou avancar (verificar_cadeia, classificar, ocorrencias_fluxo...) são instrumentados.
+  """
+  # O Varredor não deve guardar o destino das palavras repetidas, para que todas sejam registradas
+  memorizavel = False
+
+  def __init__(self, original, instrumentacao, alfabeto):
+    """
+    Inicializa a tabela instrumentada.
+
+    Atributos:
+      - original: A tabela original (qualquer tabela que possua avancar, inclusive as preguiçosas).
+      - instrumentacao: A Instrumentacao que recebe as medições.
+      - alfabeto: O alfabeto do autômato, usado para identificar os símbolos fora do alfabeto.
+    """
+    self.original = original
+    self.instrumentacao = instrumentacao
+    self.alfabeto = alfabeto
+
+  def __getattr__(self, nome):
+    # Chamado apenas para os atributos que não são da própria instância: os da tabela original
+    original = vars(self).get('original')
+    if original is None:
+      raise AttributeError(nome)
+    return getattr(original, nome)
+
+  def avancar(self, estado, cadeia):
+    """
+    Executa a tabela original a partir de um estado, registrando as transições usadas, os estados
+    visitados e o motivo da parada no estado morto. Uma leitura que parte do estado inicial conta
+    como uma visita a ele.
+    """
+    tabela = self.original
+    visitas = self.instrumentacao.visitas
+    transicoes = self.instrumentacao.transicoes
+    rejeicoes = self.instrumentacao.rejeicoes
+    if estado == tabela.inicial:
+      visitas[estado] += 1
+    for simbolo in cadeia:
+      if simbolo not in self.alfabeto:
+        rejeicoes[(FORA_DO_ALFABETO, estado, simbolo)] += 1
+        return tabela.morto
+      destino = tabela.avancar(estado, simbolo)
+      if destino == tabela.morto:
+        rejeicoes[(TRANSICAO_INDEFINIDA, estado, simbolo)] += 1
+        return destino
+      transicoes[(estado, simbolo, destino)] += 1
+      visitas[destino] += 1
+      estado = destino
+    return estado
+
+  def aceita(self, cadeia):
+    """
+    Executa a tabela original sobre a cadeia, registrando também as cadeias que terminam em um estado não final.
+    """
+    estado = self.avancar(self.original.inicial, cadeia)
+    if estado == self.original.morto:
+      return False
+    if estado not in self.original.finais:
+      self.instrumentacao.rejeicoes[(ESTADO_NAO_FINAL, estado, None)] += 1
+      return False
+    return True
+
+
+def _associar(instrumentacao, tabela):
+  """
+  Associa a instrumentação à tabela do objeto instrumentado. Os estados são identificados pelos
+  deslocamentos da tabela, então uma mesma instrumentação não pode receber medições de tabelas diferentes.
+  """
+  if instrumentacao.tabela is not None and instrumentacao.tabela is not tabela:
+    raise ValueError('A instrumentação já recebe as medições de outra tabela; use uma Instrumentacao por tabela.')
+  instrumentacao.tabela = tabela
+
+
+def instrumentar_automato(automato, instrumentacao):
+  """
+  Substitui a tabela de um autômato por uma TabelaInstrumentada e os métodos verificar_cadeia,
+  classificar (nos autômatos produto), ocorrencia_posicao e ocorrencias_fluxo por versões que registram
+  o tempo de cada chamada.
+
+  Parâmetros:
+    - automato: O autômato instrumentado.
+    - instrumentacao: A Instrumentacao que recebe as medições.
+  """
+  tabela = automato.compilar_tabela()
+  if isinstance(tabela, TabelaInstrumentada): # Instrumentado de novo: substitui a instrumentação anterior
+    tabela = tabela.original
+  _associar(instrumentacao, tabela)
+  automato._tabela = TabelaInstrumentada(tabela, instrumentacao, automato._alfabeto)
+  classe = type(automato)
+  relogio = time.perf_counter_ns
+
+  def cronometrar(nome):
+    metodo = getattr(classe, nome)
+    def funcao(*parametros):
+      inicio = relogio()
+      resultado = metodo(automato, *parametros)
+      instrumentacao.registrar_chamada(nome, relogio() - inicio)
+      return resultado
+    funcao.__name__ = nome
+    return funcao
+
+  def ocorrencias_fluxo(fluxo):
+    # O tempo registrado é o gasto dentro do gerador, sem o tempo de quem consome as ocorrências
+    duracao = 0
+    ocorrencias = classe.ocorrencias_fluxo(automato, fluxo)
+    try:
+      while True:
+        inicio = relogio()
+        try:
+          ocorrencia = next(ocorrencias)
+        except StopIteration:
+          break
+        finally:
+          duracao += relogio() - inicio
+        yield ocorrencia
+    finally:
+      instrumentacao.registrar_chamada('ocorrencias_fluxo', duracao)
+
+  funcoes = [cronometrar('verificar_cadeia'), cronometrar('ocorrencia_posicao'), ocorrencias_fluxo]
+  if hasattr(classe, 'classificar'):
+    funcoes.append(cronometrar('classificar'))
+  for funcao in funcoes:
+    funcao.__doc__ = getattr(classe, funcao.__name__).__doc__
+    setattr(automato, funcao.__name__, funcao)
+
+
+def instrumentar_moore(objeto, instrumentacao):
+  """
+  Substitui os métodos transitando, ligar, ligar_buffer e ligar_stream de um objeto que executa uma
+  Máquina de Moore compilada (com os atributos compilada e sessao, como a MaquinaRefri) por versões
+  instrumentadas.
+
+  Parâmetros:
+    - objeto: O objeto instrumentado.
+    - instrumentacao: A Instrumentacao que recebe as medições.
+  """
+  maquina = objeto.compilada
+  tabela = maquina.tabela
+  _associar(instrumentacao, tabela)
+  classes = tabela.classes
+  delta = tabela.delta
+  visitas = instrumentacao.visitas
+  transicoes = instrumentacao.transicoes
+  rejeicoes = instrumentacao.rejeicoes
+  relogio = time.perf_counter_ns
+
+  def passo(entrada):
+    # Retorna o deslocamento do estado alcançado, ou None para uma entrada inválida
+    sessao = objeto.sessao
+    classe = classes.get(entrada)
+    if classe is None:
+      rejeicoes[(ENTRADA_INVALIDA, sessao.estado, entrada)] += 1
+      return None
+    destino = delta[sessao.estado + classe]
+    if destino == tabela.morto:
+      rejeicoes[(TRANSICAO_INDEFINIDA, sessao.estado, entrada)] += 1
+    transicoes[(sessao.estado, entrada, destino)] += 1
+    visitas[destino] += 1
+    sessao.estado = destino
+    return destino
+
+  def saida(destino):
+    return maquina.invalida if destino is None else maquina.saida[destino]
+
+  def transitando(entrada):
+    inicio = relogio()
+    resultado = saida(passo(entrada))
+    instrumentacao.registrar_chamada('transitando', relogio() - inicio)
+    return resultado
+
+  def ligar(valores):
+    inicio = relogio()
+    resultado = ''.join([saida(passo(valor)) for valor in valores])
+    instrumentacao.registrar_chamada('ligar', relogio() - inicio)
+    return resultado
+
+  def ligar_buffer(valores):
+    inicio = relogio()
+    resultado = bytearray()
+    for valor in valores:
+      destino = passo(valor)
+      resultado.append(maquina.codigo_invalida if destino is None else maquina.codigo[destino])
+    instrumentacao.registrar_chamada('ligar_buffer', relogio() - inicio)
+    return resultado
+
+  def ligar_stream(valores):
+    # O tempo registrado é o gasto dentro do gerador, sem o tempo de quem consome as saídas
+    duracao = 0
+    try:
+      for valor in valores:
+        inicio = relogio()
+        resultado = saida(passo(valor))
+        duracao += relogio() - inicio
+        yield resultado
+    finally:
+      instrumentacao.registrar_chamada('ligar_stream', duracao)
+
+  for funcao in (transitando, ligar, ligar_buffer, ligar_stream):
+    funcao.__doc__ = getattr(type(objeto), funcao.__name__).__doc__
+    setattr(objeto, funcao.__name__, funcao)
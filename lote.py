@@ -0,0 +1,258 @@
+"""
+O seguinte algoritmo tem como objetivo verificar um lote de cadeias de uma só vez com NumPy:
+as cadeias são codificadas em um único array de classes de símbolos, ordenadas da mais longa para a
+mais curta, e a cada passo todas as cadeias que ainda têm símbolos avançam, por meio de consultas
+vetorizadas à tabela de transições. Como as cadeias já encerradas deixam de ser percorridas, o custo é
+proporcional à quantidade total de símbolos, e não à cadeia mais longa vezes a quantidade de cadeias.
+
+Cada passo lê m símbolos de uma vez (m = 1, 2, 4 ou 8, o maior cuja tabela composta caiba em
+LIMITE_COMPOSTA posições): as transições de m símbolos são pré-calculadas compondo a tabela consigo
+mesma, e os últimos símbolos de cada cadeia são completados com uma classe de preenchimento que mantém
+o estado. Quem já tem as cadeias codificadas (por exemplo, lidas de um arquivo como bytes) pode usar
+verificar_codificado e evitar o custo de concatenar e codificar as strings.
+"""
+import numpy as np
+
+# Quantidade máxima de posições (estados x colunas) da tabela de m símbolos
+LIMITE_COMPOSTA = 1 << 18
+# Quantidade máxima de símbolos lidos por passo
+MAXIMO_SIMBOLOS = 8
+
+def _tipo_minimo(limite):
+  """
+  Retorna o menor tipo inteiro sem sinal do NumPy capaz de representar os valores de 0 a limite - 1.
+  """
+  return np.uint8 if limite <= 1 << 8 else np.uint16 if limite <= 1 << 16 else np.uint32
+
+
+class TabelaLote:
+  """
+  Classe TabelaLote responsável por manter a tabela compilada de um autômato em arrays NumPy.
+  """
+  def __init__(self, tabela, limite=LIMITE_COMPOSTA):
+    """
+    Inicializa a tabela de lote a partir de uma TabelaCompilada.
+
+    Parâmetros:
+      - tabela: A TabelaCompilada do autômato.
+      - limite: A quantidade máxima de posições da tabela de m símbolos.
+
+    Atributos:
+      - k: A quantidade de classes de símbolos do alfabeto.
+      - colunas: A quantidade de classes de um símbolo, sendo a classe k a de símbolos fora do
+        alfabeto (leva ao estado morto) e a classe k + 1 a de preenchimento (mantém o estado).
+      - m: A quantidade de símbolos lidos por passo.
+      - largura: A quantidade de colunas da tabela de m símbolos (colunas ** m); a coluna de m
+        classes c1, ..., cm é c1 * colunas ** (m - 1) + ... + cm.
+      - delta: Um array plano com as transições de m símbolos, indexado por deslocamento + coluna, em
+        que o deslocamento de cada estado é numero_estado * largura e cada valor já é o deslocamento do destino.
+      - aceitacao: Um array booleano que indica, para cada deslocamento, se o estado é final.
+      - codigos: Um dicionário que associa o código de cada símbolo de um caractere à sua classe.
+      - mapa: Um array com a classe de cada código até o maior código do alfabeto, seguido da classe k,
+        usada por todos os códigos maiores.
+      - traducao: A tabela de bytes.translate com a classe de cada código de 0 a 255.
+      - inicial: O deslocamento do estado inicial.
+    """
+    self.k = len(tabela.simbolos)
+    self.colunas = self.k + 2
+    quantidade = len(tabela.nomes) + 1
+    morto = len(tabela.nomes)
+
+    destinos = np.array(tabela.delta, dtype=np.int32).reshape(quantidade, tabela.largura) // tabela.largura
+    delta = np.empty((quantidade, self.colunas), dtype=np.int32)
+    delta[:, :self.k] = destinos[:, :self.k]
+    delta[:, self.k] = morto
+    delta[:, self.k + 1] = np.arange(quantidade)
+
+    # Composição: a transição de 2m símbolos a partir de um estado é a de m símbolos a partir do
+    # estado alcançado pelos m primeiros
+    self.m = 1
+    while self.m < MAXIMO_SIMBOLOS and quantidade * self.colunas ** (2 * self.m) <= limite:
+      delta = delta[delta].reshape(quantidade, -1)
+      self.m *= 2
+    self.largura = self.colunas ** self.m
+    self.delta = (delta * self.largura).ravel()
+
+    self.aceitacao = np.zeros(quantidade * self.largura, dtype=bool)
+    for deslocamento in tabela.finais:
+      self.aceitacao[deslocamento // tabela.largura * self.largura] = True
+    # Símbolos com mais de um caractere nunca aparecem ao percorrer uma string
+    self.codigos = {ord(simbolo): classe for simbolo, classe in tabela.classes.items()
+                    if isinstance(simbolo, str) and len(simbolo) == 1}
+    self.mapa = np.full(max(self.codigos, default=-1) + 2, self.k, dtype=_tipo_minimo(self.colunas))
+    for codigo, classe in self.codigos.items():
+      self.mapa[codigo] = classe
+    traducao = bytearray([self.k]) * 256 if self.colunas <= 256 else None
+    if traducao is not None:
+      for codigo, classe in self.codigos.items():
+        if codigo < 256:
+          traducao[codigo] = classe
+    self.traducao = traducao if traducao is None else bytes(traducao)
+    self.inicial = tabela.inicial // tabela.largura * self.largura
+
+  def classificar(self, codigos):
+    """
+    Converte os códigos dos símbolos (pontos de código Unicode) nas suas classes.
+
+    Parâmetros:
+      - codigos: Um array inteiro do NumPy, ou bytes (um código de 0 a 255 por byte, como em latin-1).
+
+    Retorna:
+      - O array com a classe de cada símbolo.
+    """
+    if isinstance(codigos, (bytes, bytearray, memoryview)):
+      if self.traducao is not None: # bytes.translate percorre os bytes sem arrays intermediários
+        return np.frombuffer(bytes(codigos).translate(self.traducao), dtype=np.uint8)
+      codigos = np.frombuffer(codigos, dtype=np.uint8)
+    codigos = np.asarray(codigos)
+    if codigos.dtype == np.uint8 and self.traducao is not None:
+      return np.frombuffer(codigos.tobytes().translate(self.traducao), dtype=np.uint8)
+    # Os códigos acima do maior código do alfabeto caem na última posição do mapa (fora do alfabeto)
+    return self.mapa[np.minimum(codigos, len(self.mapa) - 1)]
+
+  def codificar(self, cadeias):
+    """
+    Codifica um bloco de cadeias em um array de classes de símbolos.
+
+    Parâmetros:
+      - cadeias: Uma lista de strings.
+
+    Retorna:
+      - Um tuple contendo o array com as classes dos símbolos de todas as cadeias concatenadas e o
+        vetor de comprimentos.
+    """
+    comprimentos = np.fromiter(map(len, cadeias), dtype=np.intp, count=len(cadeias))
+    texto = ''.join(cadeias)
+    try:
+      codigos = texto.encode('latin-1') # Caso comum: um byte por símbolo, sem cópias em UTF-32
+    except UnicodeEncodeError:
+      # surrogatepass: um surrogate isolado vira um código como outro qualquer, fora do alfabeto
+      codigos = np.frombuffer(texto.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    return self.classificar(codigos), comprimentos
+
+  def executar(self, cadeias):
+    """
+    Executa a tabela sobre um bloco de cadeias.
+
+    Parâmetros:
+      - cadeias: Uma lista de strings.
+
+    Retorna:
+      - Um array booleano com o resultado da verificação de cada cadeia.
+    """
+    return self.executar_classes(*self.codificar(cadeias))
+
+  def executar_classes(self, classes, comprimentos):
+    """
+    Executa a tabela sobre cadeias já convertidas em classes de símbolos (ver codificar e classificar).
+
+    Parâmetros:
+      - classes: O array com as classes dos símbolos de todas as cadeias concatenadas.
+      - comprimentos: O vetor com o comprimento de cada cadeia.
+
+    Retorna:
+      - Um array booleano com o resultado da verificação de cada cadeia.
+    """
+    comprimentos = np.asarray(comprimentos, dtype=np.intp)
+    quantidade = len(comprimentos)
+    if len(classes) != int(comprimentos.sum()):
+      raise ValueError('A soma dos comprimentos difere da quantidade de símbolos codificados.')
+    if quantidade == 0:
+      return np.zeros(0, dtype=bool)
+    m = self.m
+    colunas = self.colunas
+    preenchimento = self.k + 1
+
+    # Colunas de m símbolos a partir de cada posição; o preenchimento final garante que toda posição
+    # de início de uma cadeia tenha uma coluna, mesmo que ultrapasse o fim da entrada
+    tipo = _tipo_minimo(self.largura)
+    gramas = np.empty(len(classes) + m, dtype=tipo)
+    gramas[:len(classes)] = classes
+    gramas[len(classes):] = preenchimento
+    largura = 1
+    while largura < m:
+      gramas = gramas[:-largura] * tipo(colunas ** largura) + gramas[largura:]
+      largura *= 2
+
+    # Ordenação por contagem: a ordenação estável do NumPy para inteiros de 8 ou 16 bits é uma radix
+    # sort, linear na quantidade de cadeias; as demais grandezas por cadeia saem das contagens de
+    # cada comprimento, já na ordem decrescente
+    maior = int(comprimentos.max())
+    contagem = np.bincount(comprimentos)[::-1] # contagem[i]: cadeias de comprimento maior - i
+    chave = (maior - comprimentos).astype(_tipo_minimo(maior + 1) if maior < 1 << 16 else np.intp)
+    ordem = np.argsort(chave, kind='stable')
+    inicios = np.cumsum(comprimentos)
+    inicios -= comprimentos
+    inicios = inicios[ordem]
+
+    # Cada cadeia dá passos completos de m símbolos e, se o comprimento não é múltiplo de m, um último
+    # passo com os símbolos restantes completados pelo preenchimento
+    tamanhos = np.arange(maior, -1, -1)
+    restos = np.repeat((tamanhos % m).astype(np.uint8), contagem)
+    ultimas = inicios + np.repeat(tamanhos - tamanhos % m, contagem)
+    # Resto 0 não tem passo incompleto: divisor 1 e sufixo 0 apenas evitam estourar o tipo
+    divisores = np.array([1] + [colunas ** (m - resto) for resto in range(1, m)], dtype=tipo)
+    sufixos = np.array([0] + [(int(divisores[resto]) - 1) // (colunas - 1) * preenchimento for resto in range(1, m)],
+                       dtype=tipo)
+    finais = np.take(gramas, ultimas, mode='clip')
+    divisor = divisores[restos]
+    finais //= divisor
+    finais *= divisor
+    finais += sufixos[restos]
+    passos = (tamanhos + m - 1) // m
+    ativas = quantidade - np.cumsum(np.bincount(passos, contagem)).astype(np.intp) # Mais de t passos
+    cheias = quantidade - np.cumsum(np.bincount(tamanhos // m, contagem, len(ativas))).astype(np.intp) # Passo t completo
+
+    estados = np.full(quantidade, self.inicial, dtype=np.int32)
+    indices = np.empty(quantidade, dtype=np.intp)
+    colunas_passo = np.empty(quantidade, dtype=tipo)
+    delta = self.delta
+    for passo in range(int(passos[0])):
+      ativos = int(ativas[passo])
+      completos = int(cheias[passo])
+      np.take(gramas, inicios[:completos], out=colunas_passo[:completos], mode='clip')
+      colunas_passo[completos:ativos] = finais[completos:ativos]
+      np.add(estados[:ativos], colunas_passo[:ativos], out=indices[:ativos])
+      np.take(delta, indices[:ativos], out=estados[:ativos], mode='clip') # Os índices são sempre válidos
+      inicios[:completos] += m
+
+    resultado = np.empty(quantidade, dtype=bool)
+    resultado[ordem] = self.aceitacao[estados]
+    return resultado
+
+
+def verificar_lote(tabela_lote, cadeias, tamanho_bloco=1 << 16):
+  """
+  Verifica um lote de cadeias, processando-as em blocos para limitar a memória usada na codificação.
+
+  Parâmetros:
+    - tabela_lote: A TabelaLote do autômato.
+    - cadeias: Uma sequência de strings a serem verificadas.
+    - tamanho_bloco: A quantidade máxima de cadeias codificadas de uma vez.
+
+  Retorna:
+    - Um array booleano com o resultado da verificação de cada cadeia.
+  """
+  cadeias = list(cadeias)
+  resultado = np.empty(len(cadeias), dtype=bool)
+  for inicio in range(0, len(cadeias), tamanho_bloco):
+    bloco = cadeias[inicio:inicio + tamanho_bloco]
+    resultado[inicio:inicio + len(bloco)] = tabela_lote.executar(bloco)
+  return resultado
+
+
+def verificar_codificado(tabela_lote, codigos, comprimentos):
+  """
+  Verifica um lote de cadeias já codificadas, sem criar uma string para cada cadeia.
+
+  Parâmetros:
+    - tabela_lote: A TabelaLote do autômato.
+    - codigos: Os códigos (pontos de código Unicode) dos símbolos de todas as cadeias concatenadas,
+      como um array inteiro do NumPy ou como bytes (um código de 0 a 255 por byte, como em latin-1).
+    - comprimentos: A quantidade de símbolos de cada cadeia.
+
+  Retorna:
+    - Um array booleano com o resultado da verificação de cada cadeia, o mesmo de verificar_lote
+      sobre as strings correspondentes.
+  """
+  return tabela_lote.executar_classes(tabela_lote.classificar(codigos), comprimentos)
@@ -0,0 +1,143 @@
+"""
+O seguinte algoritmo tem como objetivo minimizar um autômato finito determinístico por meio do
+refinamento de partições de Hopcroft, com custo O(n·k·log n) para n estados e k símbolos.
+"""
+from collections import deque
+
+def alcancaveis(tabela):
+  """
+  Obtém os estados da tabela alcançáveis a partir do estado inicial.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada do autômato.
+
+  Retorna:
+    - Uma lista com os números dos estados alcançáveis, em ordem de busca em largura.
+  """
+  k = len(tabela.simbolos)
+  visitados = {0}
+  ordem = [0]
+  fila = deque(ordem)
+  while fila:
+    estado = fila.popleft()
+    for classe in range(k):
+      destino = tabela.proximo(estado, classe)
+      if destino not in visitados:
+        visitados.add(destino)
+        ordem.append(destino)
+        fila.append(destino)
+  return ordem
+
+
+def hopcroft(tabela, rotulos=None):
+  """
+  Agrupa os estados equivalentes da tabela fornecida.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada do autômato.
+    - rotulos: Uma lista com o rótulo de cada número de estado, incluindo o estado morto (por
+      padrão, se o estado é final). Dois estados só são equivalentes se todas as cadeias os levam
+      a estados de mesmo rótulo, como em uma Máquina de Moore.
+
+  Retorna:
+    - Um tuple contendo uma lista que associa cada número de estado ao número do seu bloco
+      (None para estados inalcançáveis ou equivalentes ao estado morto) e a quantidade de blocos.
+      Os blocos são numerados em ordem de busca em largura a partir do estado inicial, que fica no bloco 0.
+  """
+  k = len(tabela.simbolos)
+  largura = tabela.largura
+  delta = tabela.delta
+  morto = len(tabela.nomes)
+  ordem = alcancaveis(tabela)
+  # O estado morto sempre participa da partição, para agrupar os estados que não levam a nenhum final
+  participantes = ordem if morto in ordem else ordem + [morto]
+
+  # Transições inversas: inversas[destino * k + classe] lista os estados de origem
+  inversas = {}
+  for origem in participantes:
+    linha = origem * largura
+    for classe in range(k):
+      destino = delta[linha + classe] // largura
+      inversas.setdefault(destino * k + classe, []).append(origem)
+
+  # Partição inicial: um bloco por rótulo (estados finais e não finais, por padrão)
+  grupos = {}
+  for estado in participantes:
+    rotulo = estado * largura in tabela.finais if rotulos is None else rotulos[estado]
+    grupos.setdefault(rotulo, []).append(estado)
+  blocos = [set(parte) for parte in grupos.values()]
+  bloco_de = [None] * (morto + 1)
+  for numero, bloco in enumerate(blocos):
+    for estado in bloco:
+      bloco_de[estado] = numero
+  # Todos os blocos menos o maior precisam dividir os demais
+  pendentes = set(range(len(blocos)))
+  pendentes.discard(max(pendentes, key=lambda numero: len(blocos[numero])))
+
+  # Refinamento: cada bloco pendente divide os blocos que possuem estados que levam a ele
+  while pendentes:
+    divisor = list(blocos[pendentes.pop()])
+    for classe in range(k):
+      atingidos = {}
+      for destino in divisor:
+        for origem in inversas.get(destino * k + classe, ()):
+          atingidos.setdefault(bloco_de[origem], []).append(origem)
+      for numero, dentro in atingidos.items():
+        bloco = blocos[numero]
+        if len(dentro) == len(bloco):
+          continue
+        # A parte menor ganha um novo bloco e entra na lista de pendentes
+        if 2 * len(dentro) <= len(bloco):
+          novo = set(dentro)
+          bloco -= novo
+        else:
+          novo = bloco - set(dentro)
+          bloco.intersection_update(dentro)
+        novo_numero = len(blocos)
+        blocos.append(novo)
+        for estado in novo:
+          bloco_de[estado] = novo_numero
+        pendentes.add(novo_numero)
+
+  # Renumeração em ordem de busca em largura, descartando o bloco equivalente ao estado morto
+  bloco_morto = bloco_de[morto]
+  renumeracao = {}
+  for estado in ordem:
+    numero = bloco_de[estado]
+    if numero != bloco_morto and numero not in renumeracao:
+      renumeracao[numero] = len(renumeracao)
+  resultado = [renumeracao.get(numero) for numero in bloco_de]
+  return resultado, len(renumeracao)
+
+
+def quociente(tabela, rotulos=None):
+  """
+  Constrói as transições do autômato mínimo, com um estado por bloco de estados equivalentes.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada do autômato.
+    - rotulos: Os rótulos dos estados (ver hopcroft).
+
+  Retorna:
+    - Um tuple contendo a lista de novos estados 'q0', 'q1', ... (sendo 'q0' o inicial), o
+      dicionário de transições entre eles, uma lista com o número de um estado original de cada
+      bloco (None quando a linguagem é vazia) e a lista que associa cada número de estado ao seu bloco.
+  """
+  bloco_de, quantidade = hopcroft(tabela, rotulos)
+  novos = ['q' + str(numero) for numero in range(max(quantidade, 1))]
+  representantes = [None] * len(novos)
+  for estado in range(len(tabela.nomes)):
+    bloco = bloco_de[estado]
+    if bloco is not None and representantes[bloco] is None:
+      representantes[bloco] = estado
+
+  # Qualquer estado do bloco serve como representante para as transições
+  transicoes = {}
+  for bloco, estado in enumerate(representantes):
+    if estado is None: # Linguagem vazia: resta apenas o estado inicial, sem transições
+      continue
+    for classe, simbolo in enumerate(tabela.simbolos):
+      destino = bloco_de[tabela.proximo(estado, classe)]
+      if destino is not None:
+        transicoes[(novos[bloco], simbolo)] = novos[destino]
+  return novos, transicoes, representantes, bloco_de
@@ -0,0 +1,189 @@
+"""
+O seguinte algoritmo tem como objetivo executar Máquinas de Moore a partir de tabelas de inteiros
+compiladas uma única vez. A máquina compilada é compartilhada, e cada execução guarda apenas o
+seu estado corrente em uma sessão leve.
+"""
+import automato
+
+class MooreCompilada:
+  """
+  Classe MooreCompilada responsável por compilar a definição de uma Máquina de Moore (transições e
+  saídas por estado) em tabelas de inteiros compartilhadas entre as sessões.
+  """
+  def __init__(self, transicoes, saidas, estadoInicial, saidaInvalida='Nr'):
+    """
+    Inicializa a máquina compilada.
+
+    Parâmetros:
+      - transicoes: Um dicionário estado -> {entrada: estado destino}.
+      - saidas: Um dicionário que associa cada estado à sua saída.
+      - estadoInicial: O estado inicial das sessões.
+      - saidaInvalida: A saída produzida por uma entrada inválida, que não muda o estado.
+
+    Atributos:
+      - tabela: A TabelaCompilada das transições, com as entradas como alfabeto.
+      - simbolos_saida: Uma lista com as saídas possíveis; o código de uma saída é a sua posição.
+      - saida: Uma lista com a saída de cada deslocamento de estado da tabela.
+      - codigo: Uma lista com o código da saída de cada deslocamento de estado da tabela.
+      - invalida: A saída de uma entrada inválida.
+      - codigo_invalida: O código da saída de uma entrada inválida.
+    """
+    planas = {(origem, entrada): destino for origem, destinos in transicoes.items() for entrada, destino in destinos.items()}
+    entradas = {entrada for destinos in transicoes.values() for entrada in destinos}
+    self.tabela = automato.TabelaCompilada(set(transicoes) | set(saidas), entradas, planas, estadoInicial, set())
+    self.simbolos_saida = list(dict.fromkeys(list(saidas.values()) + [saidaInvalida]))
+    codigos = {simbolo: codigo for codigo, simbolo in enumerate(self.simbolos_saida)}
+    self.invalida = saidaInvalida
+    self.codigo_invalida = codigos[saidaInvalida]
+
+    # O estado morto (uma entrada válida sem transição definida) produz a saída de inválido
+    largura = self.tabela.largura
+    self.saida = [saidaInvalida] * len(self.tabela.delta)
+    self.codigo = [self.codigo_invalida] * len(self.tabela.delta)
+    for numero, estado in enumerate(self.tabela.nomes):
+      if estado in saidas:
+        self.saida[numero * largura] = saidas[estado]
+        self.codigo[numero * largura] = codigos[saidas[estado]]
+
+  def deslocamento(self, estado):
+    """
+    Obtém o deslocamento de um estado na tabela.
+
+    Parâmetros:
+      - estado: O estado da máquina.
+
+    Retorna:
+      - O deslocamento correspondente.
+    """
+    return self.tabela.nomes.index(estado) * self.tabela.largura
+
+  def sessao(self, estado=None):
+    """
+    Cria uma nova sessão da máquina.
+
+    Parâmetros:
+      - estado: O estado inicial da sessão (por padrão, o estado inicial da máquina).
+
+    Retorna:
+      - Uma Sessao.
+    """
+    return Sessao(self, self.tabela.inicial if estado is None else self.deslocamento(estado))
+
+
+class Sessao:
+  """
+  Classe Sessao responsável por executar uma máquina compilada, guardando apenas o estado corrente.
+  """
+  __slots__ = ('maquina', 'estado')
+
+  def __init__(self, maquina, estado):
+    """
+    Inicializa a sessão.
+
+    Atributos:
+      - maquina: A MooreCompilada executada.
+      - estado: O deslocamento do estado corrente na tabela da máquina.
+    """
+    self.maquina = maquina
+    self.estado = estado
+
+  @property
+  def estado_corrente(self):
+    """
+    O estado corrente, com o nome original da definição da máquina.
+    """
+    return self.maquina.tabela.nome(self.estado)
+
+  def transitando(self, entrada):
+    """
+    Realiza a transição de acordo com a entrada fornecida.
+
+    Parâmetros:
+      - entrada: A entrada lida.
+
+    Retorna:
+      - A saída do estado alcançado, ou a saída de inválido se a entrada for inválida.
+    """
+    maquina = self.maquina
+    classe = maquina.tabela.classes.get(entrada)
+    if classe is None:
+      return maquina.invalida
+    self.estado = maquina.tabela.delta[self.estado + classe]
+    return maquina.saida[self.estado]
+
+  def ligar_stream(self, entradas):
+    """
+    Executa a máquina sobre as entradas à medida que chegam.
+
+    Parâmetros:
+      - entradas: Um iterável com as entradas (pode ser infinito, como um fluxo de moedas).
+
+    Retorna:
+      - Um gerador com a saída de cada entrada.
+    """
+    maquina = self.maquina
+    classes = maquina.tabela.classes
+    delta = maquina.tabela.delta
+    saida = maquina.saida
+    invalida = maquina.invalida
+    for entrada in entradas:
+      classe = classes.get(entrada)
+      if classe is None:
+        yield invalida
+      else:
+        self.estado = delta[self.estado + classe]
+        yield saida[self.estado]
+
+  def ligar(self, entradas):
+    """
+    Executa a máquina sobre uma sequência de entradas.
+
+    Parâmetros:
+      - entradas: Um iterável com as entradas.
+
+    Retorna:
+      - Uma string contendo as saídas de cada transição.
+    """
+    maquina = self.maquina
+    classes = maquina.tabela.classes
+    delta = maquina.tabela.delta
+    saida = maquina.saida
+    invalida = maquina.invalida
+    estado = self.estado
+    produzidas = []
+    for entrada in entradas:
+      classe = classes.get(entrada)
+      if classe is None:
+        produzidas.append(invalida)
+      else:
+        estado = delta[estado + classe]
+        produzidas.append(saida[estado])
+    self.estado = estado
+    return ''.join(produzidas)
+
+  def ligar_buffer(self, entradas):
+    """
+    Executa a máquina sobre uma sequência de entradas, produzindo as saídas em um buffer de bytes.
+
+    Parâmetros:
+      - entradas: Um iterável com as entradas.
+
+    Retorna:
+      - Um bytearray com o código da saída de cada entrada (a saída é maquina.simbolos_saida[codigo]).
+    """
+    maquina = self.maquina
+    classes = maquina.tabela.classes
+    delta = maquina.tabela.delta
+    codigo = maquina.codigo
+    invalida = maquina.codigo_invalida
+    estado = self.estado
+    produzidas = bytearray()
+    for entrada in entradas:
+      classe = classes.get(entrada)
+      if classe is None:
+        produzidas.append(invalida)
+      else:
+        estado = delta[estado + classe]
+        produzidas.append(codigo[estado])
+    self.estado = estado
+    return produzidas
@@ -0,0 +1,281 @@
+"""
+O seguinte algoritmo tem como objetivo executar um autômato sobre uma entrada muito longa usando
+vários processos. O efeito de um trecho da entrada sobre o autômato é uma função estado -> estado,
+que pode ser calculada sem conhecer o estado em que o trecho começa; cada processo calcula a função
+do seu trecho, as funções são compostas em ordem (varredura de prefixos) para descobrir o estado de
+entrada de cada trecho e, quando necessário, cada processo percorre de novo o seu trecho a partir do
+estado correto para obter o estado (ou a saída) em cada posição.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+# Entradas menores que isso são executadas no próprio processo
+MINIMO_PARALELO = 1 << 16
+# Quantidade máxima de posições de vetores de estados calculadas por funcao_trecho, no total e por
+# símbolo do trecho; acima disso os vetores não estão se fundindo e o trecho é percorrido de forma
+# sequencial (ver estados_de_entrada)
+LIMITE_POSICOES = 1 << 20
+POSICOES_POR_SIMBOLO = 4
+
+def funcao_trecho(tabela, trecho, ignorar_invalidos=False):
+  """
+  Calcula a função estado -> estado de um trecho da entrada. Todos os estados são percorridos juntos,
+  como um vetor de estados; os vetores já vistos recebem um número e as transições entre eles ficam
+  guardadas, de forma que, depois de aquecido, cada símbolo custa uma consulta, como em uma execução comum.
+  Se os vetores não se fundem (por exemplo, quando cada símbolo permuta os estados), cada novo vetor
+  custa um passo por estado; ao atingir LIMITE_POSICOES posições calculadas (ou POSICOES_POR_SIMBOLO
+  por símbolo do trecho, o custo de poucas execuções comuns), o cálculo é abandonado.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada.
+    - trecho: Uma sequência de símbolos.
+    - ignorar_invalidos: Se True, símbolos fora do alfabeto mantêm o estado; caso contrário, levam ao estado morto.
+
+  Retorna:
+    - Uma lista em que a posição i contém o número do estado alcançado a partir do estado número i
+      (o estado morto é o número len(tabela.nomes)), ou None se o limite de posições foi atingido.
+  """
+  largura = tabela.largura
+  classes = tabela.classes
+  delta = tabela.delta
+  quantidade = len(tabela.nomes) + 1
+  restantes = min(LIMITE_POSICOES, POSICOES_POR_SIMBOLO * len(trecho)) - quantidade
+  if restantes < 0:
+    return None
+  inicial = tuple(numero * largura for numero in range(quantidade))
+  vetores = [inicial]
+  numeros = {inicial: 0}
+  proximos = [-1] * largura # proximos[numero_vetor * largura + classe]: deslocamento do vetor destino
+  atual = 0
+  for simbolo in trecho:
+    classe = classes.get(simbolo)
+    if classe is None:
+      if ignorar_invalidos:
+        continue
+      return [quantidade - 1] * quantidade # Todos os caminhos vão para o estado morto e lá ficam
+    destino = proximos[atual + classe]
+    if destino < 0:
+      restantes -= quantidade # Limita tanto o tempo quanto a memória dos vetores guardados
+      if restantes < 0:
+        return None
+      vetor = tuple(delta[estado + classe] for estado in vetores[atual // largura])
+      numero = numeros.get(vetor)
+      if numero is None:
+        numero = numeros[vetor] = len(vetores)
+        vetores.append(vetor)
+        proximos.extend([-1] * largura)
+      destino = proximos[atual + classe] = numero * largura
+    atual = destino
+  return [estado // largura for estado in vetores[atual // largura]]
+
+
+def estado_final(tabela, trecho, estado, ignorar_invalidos=False):
+  """
+  Percorre um trecho a partir de um estado conhecido, como em uma execução comum.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada.
+    - trecho: Uma sequência de símbolos.
+    - estado: O número do estado de partida.
+    - ignorar_invalidos: Se True, símbolos fora do alfabeto mantêm o estado; caso contrário, levam ao estado morto.
+
+  Retorna:
+    - O número do estado alcançado ao final do trecho.
+  """
+  largura = tabela.largura
+  classes = tabela.classes
+  delta = tabela.delta
+  morto = tabela.morto
+  estado *= largura
+  for simbolo in trecho:
+    classe = classes.get(simbolo)
+    if classe is not None:
+      estado = delta[estado + classe]
+    elif not ignorar_invalidos:
+      estado = morto
+    if estado == morto: # O estado morto nunca é deixado
+      break
+  return estado // largura
+
+
+def tipo_estados(tabela):
+  """
+  Escolhe o menor tipo de array capaz de guardar os números dos estados da tabela (incluindo o
+  estado morto), para que a sequência de estados de uma entrada longa ocupe o mínimo de memória e
+  seja enviada entre os processos com o mínimo de bytes.
+
+  Retorna:
+    - O código de tipo do módulo array ('B', 'H', 'I' ou 'L').
+  """
+  quantidade = len(tabela.nomes) + 1
+  for tipo in 'BHIL':
+    if quantidade <= 1 << (8 * array(tipo).itemsize):
+      return tipo
+  raise ValueError('A tabela tem estados demais para um array de estados.')
+
+
+def estados_trecho(tabela, trecho, estado, ignorar_invalidos=False):
+  """
+  Percorre um trecho a partir de um estado conhecido, registrando o estado após cada símbolo.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada.
+    - trecho: Uma sequência de símbolos.
+    - estado: O número do estado de partida.
+    - ignorar_invalidos: Se True, símbolos fora do alfabeto mantêm o estado; caso contrário, levam ao estado morto.
+
+  Retorna:
+    - Um array (do tipo de tipo_estados) com o número do estado após cada símbolo.
+  """
+  largura = tabela.largura
+  classes = tabela.classes
+  delta = tabela.delta
+  morto = tabela.morto
+  estado *= largura
+  estados = array(tipo_estados(tabela))
+  for simbolo in trecho:
+    classe = classes.get(simbolo)
+    if classe is not None:
+      estado = delta[estado + classe]
+    elif not ignorar_invalidos:
+      estado = morto
+    estados.append(estado // largura)
+  return estados
+
+
+def saidas_trecho(tabela, trecho, estado, saidas, invalido, final=False):
+  """
+  Percorre um trecho a partir de um estado conhecido, como uma Máquina de Moore: cada símbolo
+  produz a saída do estado alcançado, e cada símbolo fora do alfabeto produz a saída de inválido
+  sem mudar o estado.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada.
+    - trecho: Uma sequência de símbolos.
+    - estado: O número do estado de partida.
+    - saidas: Uma lista com a saída de cada número de estado.
+    - invalido: A saída produzida por um símbolo fora do alfabeto.
+    - final: Se True, também retorna o número do estado alcançado ao final do trecho.
+
+  Retorna:
+    - Uma string com as saídas do trecho ou, se final for True, um tuple contendo a string e o
+      número do estado final.
+  """
+  largura = tabela.largura
+  classes = tabela.classes
+  delta = tabela.delta
+  por_deslocamento = {numero * largura: saida for numero, saida in enumerate(saidas)}
+  estado *= largura
+  produzidas = []
+  for simbolo in trecho:
+    classe = classes.get(simbolo)
+    if classe is None:
+      produzidas.append(invalido)
+    else:
+      estado = delta[estado + classe]
+      produzidas.append(por_deslocamento[estado])
+  if final:
+    return ''.join(produzidas), estado // largura
+  return ''.join(produzidas)
+
+
+def dividir(entrada, partes):
+  """
+  Divide a entrada em trechos contíguos de tamanhos próximos.
+
+  Parâmetros:
+    - entrada: Uma sequência de símbolos (string ou lista).
+    - partes: A quantidade de trechos.
+
+  Retorna:
+    - Uma lista com os trechos.
+  """
+  tamanho = len(entrada)
+  limites = [tamanho * parte // partes for parte in range(partes + 1)]
+  return [entrada[inicio:fim] for inicio, fim in zip(limites, limites[1:]) if fim > inicio]
+
+
+def estados_de_entrada(funcoes, inicial, percorrer=None):
+  """
+  Compõe em ordem as funções dos trechos (varredura de prefixos exclusiva).
+
+  Parâmetros:
+    - funcoes: A lista com a função estado -> estado de cada trecho (ou None, se não foi calculada).
+    - inicial: O número do estado em que a entrada começa.
+    - percorrer: Uma função (índice do trecho, estado de entrada) -> estado final, usada para os
+      trechos cuja função é None.
+
+  Retorna:
+    - Uma lista com o número do estado de entrada de cada trecho, seguida do estado final da entrada.
+  """
+  entradas = [inicial]
+  for indice, funcao in enumerate(funcoes):
+    if funcao is None:
+      entradas.append(percorrer(indice, entradas[-1]))
+    else:
+      entradas.append(funcao[entradas[-1]])
+  return entradas
+
+
+def _mapear(executor, funcao, *listas):
+  """
+  Aplica a função aos argumentos no conjunto de processos.
+  """
+  return list(executor.map(funcao, *listas))
+
+
+def executar(tabela, entrada, processos=None, ignorar_invalidos=False, estados=False, saidas=None, invalido='', inicial=None):
+  """
+  Executa a tabela sobre a entrada, em paralelo.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada.
+    - entrada: Uma sequência de símbolos (string ou lista).
+    - processos: A quantidade de processos (por padrão, a quantidade de processadores).
+    - ignorar_invalidos: Se True, símbolos fora do alfabeto mantêm o estado; caso contrário, levam ao estado morto.
+    - estados: Se True, também calcula o estado após cada símbolo.
+    - saidas: Uma lista com a saída de cada número de estado, para executar como Máquina de Moore.
+    - invalido: A saída de um símbolo fora do alfabeto, quando saidas é informado.
+    - inicial: O número do estado em que a entrada começa (por padrão, o estado inicial da tabela).
+
+  Retorna:
+    - Um tuple contendo o número do estado final e, conforme o pedido, o array com o estado após
+      cada símbolo ou a string com as saídas da Máquina de Moore (None caso contrário).
+  """
+  processos = processos or os.cpu_count() or 1
+  if len(entrada) < MINIMO_PARALELO:
+    processos = 1
+  trechos = dividir(entrada, processos)
+  if inicial is None:
+    inicial = tabela.inicial // tabela.largura
+  if not trechos:
+    return inicial, (array(tipo_estados(tabela)) if estados else '' if saidas is not None else None)
+  if len(trechos) == 1: # Sem paralelismo, a função do trecho seria apenas uma passagem a mais
+    if saidas is not None:
+      resultado, final = saidas_trecho(tabela, entrada, inicial, saidas, invalido, final=True)
+      return final, resultado
+    if estados:
+      resultado = estados_trecho(tabela, entrada, inicial, ignorar_invalidos)
+      return (resultado[-1] if resultado else inicial), resultado
+    return estado_final(tabela, entrada, inicial, ignorar_invalidos), None
+
+  executor = ProcessPoolExecutor(max_workers=len(trechos))
+  try:
+    tabelas = [tabela] * len(trechos)
+    funcoes = _mapear(executor, funcao_trecho, tabelas, trechos, [ignorar_invalidos] * len(trechos))
+    # Os trechos cujos vetores não se fundiram são percorridos aqui, a partir do estado já conhecido
+    entradas = estados_de_entrada(funcoes, inicial,
+                                  lambda indice, estado: estado_final(tabela, trechos[indice], estado, ignorar_invalidos))
+    resultado = None
+    if saidas is not None:
+      partes = _mapear(executor, saidas_trecho, tabelas, trechos, entradas[:-1],
+                       [saidas] * len(trechos), [invalido] * len(trechos))
+      resultado = ''.join(partes)
+    elif estados:
+      resultado = array(tipo_estados(tabela))
+      for parte in _mapear(executor, estados_trecho, tabelas, trechos, entradas[:-1], [ignorar_invalidos] * len(trechos)):
+        resultado.extend(parte)
+  finally:
+    executor.shutdown()
+  return entradas[-1], resultado
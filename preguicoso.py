@@ -0,0 +1,232 @@
+"""
+O seguinte algoritmo tem como objetivo executar um autômato não determinístico sem construir antes o
+autômato determinístico inteiro, cujo número de estados pode crescer exponencialmente. Os estados
+determinísticos (conjuntos de estados do AFN) são construídos apenas quando a entrada chega a eles e
+ficam em um cache de tamanho limitado; quando o cache enche ele é esvaziado, e se isso acontece com
+frequência demais (o cache não está sendo aproveitado) a execução passa a simular o AFN diretamente
+por um tempo, como faz o RE2.
+"""
+import automato
+import expressao_regular
+
+LIMITE_ESTADOS = 10000
+# O cache é considerado ineficiente se, entre dois esvaziamentos, foram lidos menos símbolos que
+# LEITURAS_POR_ESTADO vezes a quantidade de estados construídos
+LEITURAS_POR_ESTADO = 10
+
+class Finais:
+  """
+  Classe Finais responsável por indicar se um estado determinístico é final, isto é, se o conjunto
+  contém o estado final do AFN.
+  """
+  def __init__(self, final):
+    """
+    Inicializa o conjunto de finais a partir do estado final do AFN.
+    """
+    self.final = final
+
+  def __contains__(self, estado):
+    """
+    Retorna True se o estado determinístico contém o estado final do AFN.
+    """
+    return self.final in estado
+
+
+class TabelaPreguicosa:
+  """
+  Classe TabelaPreguicosa responsável por executar um AFN com a mesma interface da TabelaCompilada
+  (inicial, morto, finais, aceita, avancar e nome), em que cada estado é um frozenset de estados do AFN.
+  """
+  def __init__(self, afn, alfabeto, limite_estados=LIMITE_ESTADOS):
+    """
+    Inicializa a tabela.
+
+    Atributos:
+      - afn: O AFN executado.
+      - alfabeto: O conjunto de símbolos aceitos.
+      - limite_estados: A quantidade máxima de estados determinísticos no cache.
+      - inicial: O estado inicial (fecho em vazio do estado inicial do AFN).
+      - morto: O estado morto (conjunto vazio).
+      - finais: Um objeto que indica, pelo operador in, se um estado é final.
+      - esvaziamentos: Quantas vezes o cache foi esvaziado.
+      - simulados: Quantos símbolos foram lidos pela simulação do AFN, sem o cache.
+    """
+    self.afn = afn
+    self.alfabeto = frozenset(alfabeto)
+    self.limite_estados = limite_estados
+    self.inicial = afn.fecho([afn.inicial])
+    self.morto = frozenset()
+    self.finais = Finais(afn.final)
+    self.esvaziamentos = 0
+    self.simulados = 0
+    self._cache = {}
+    self._lidos = 0 # Símbolos lidos desde o último esvaziamento
+    self._simular = 0 # Símbolos que ainda serão lidos pela simulação do AFN
+
+  def _esvaziar(self):
+    """
+    Esvazia o cache cheio e, se ele não estava sendo aproveitado, passa a simular o AFN por um tempo.
+    """
+    if self._lidos < LEITURAS_POR_ESTADO * len(self._cache):
+      self._simular = LEITURAS_POR_ESTADO * self.limite_estados
+    self._cache.clear()
+    self._lidos = 0
+    self.esvaziamentos += 1
+
+  def avancar(self, estado, cadeia):
+    """
+    Executa o autômato sobre a cadeia fornecida a partir de um estado qualquer.
+
+    Parâmetros:
+      - estado: O estado de partida.
+      - cadeia: Uma string contendo os próximos símbolos a serem lidos.
+
+    Retorna:
+      - O estado alcançado (o estado morto se algum símbolo estiver fora do alfabeto).
+    """
+    alfabeto = self.alfabeto
+    cache = self._cache
+    for simbolo in cadeia:
+      if estado == self.morto or simbolo not in alfabeto:
+        return self.morto
+      if self._simular:
+        self._simular -= 1
+        self.simulados += 1
+        estado = self.afn.mover(estado, simbolo)
+        continue
+      self._lidos += 1
+      transicoes = cache.get(estado)
+      if transicoes is None:
+        if len(cache) >= self.limite_estados:
+          self._esvaziar()
+        transicoes = cache[estado] = {}
+      destino = transicoes.get(simbolo)
+      if destino is None:
+        destino = transicoes[simbolo] = self.afn.mover(estado, simbolo)
+      estado = destino
+    return estado
+
+  def aceita(self, cadeia):
+    """
+    Verifica se a cadeia fornecida é aceita.
+
+    Parâmetros:
+      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
+
+    Retorna:
+      - True se a cadeia for aceita, False caso contrário.
+    """
+    return self.avancar(self.inicial, cadeia) in self.finais
+
+  def nome(self, estado):
+    """
+    Obtém o nome de um estado, que é o próprio conjunto de estados do AFN.
+    """
+    return estado
+
+
+class AutomatoPreguicoso(automato.Automato):
+  """
+  Classe AutomatoPreguicoso responsável por instanciar autômatos definidos por um AFN, determinizados
+  sob demanda. Funciona em todos os lugares que usam apenas verificar_cadeia e compilar_tabela, como a
+  varredura de textos de ocorrencia_posicao e ocorrencias_fluxo.
+  """
+  def __init__(self, afn, alfabeto=(), limite_estados=LIMITE_ESTADOS):
+    """
+    Inicializa o autômato.
+
+    Parâmetros:
+      - afn: O AFN (expressao_regular.AFN) que define o autômato.
+      - alfabeto: Símbolos a serem incluídos no alfabeto além dos usados no AFN.
+      - limite_estados: A quantidade máxima de estados determinísticos guardados em memória.
+    """
+    alfabeto = set(afn.alfabeto) | set(alfabeto)
+    super().__init__(None, alfabeto, None, afn.fecho([afn.inicial]), None)
+    self._afn = afn
+    self._limite_estados = limite_estados
+
+  def compilar_tabela(self):
+    """
+    Cria a tabela preguiçosa do autômato, reaproveitando-a nas chamadas seguintes.
+
+    Retorna:
+      - A TabelaPreguicosa correspondente ao autômato.
+    """
+    if self._tabela is None:
+      self._tabela = TabelaPreguicosa(self._afn, self._alfabeto, self._limite_estados)
+    return self._tabela
+
+  def _novo(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais):
+    """
+    Os autômatos construídos a partir deste (como o mínimo) são autômatos comuns.
+    """
+    return automato.Automato(estados, alfabeto, transicoes, estadoInicial, estadosFinais)
+
+  def materializar(self):
+    """
+    Constrói o autômato determinístico inteiro pela construção de subconjuntos.
+
+    Retorna:
+      - Um Automato equivalente, com estados 'q0', 'q1', ...
+    """
+    return expressao_regular.subconjuntos(self._afn, self._alfabeto)
+
+  def minimizar(self):
+    """
+    Minimiza o autômato materializado (ver Automato.minimizar); o mapeamento usa os estados de materializar().
+    """
+    return self.materializar().minimizar()
+
+  def verificar_lote(self, cadeias):
+    """
+    Verifica um lote de cadeias pela tabela preguiçosa. Requer o NumPy.
+
+    Parâmetros:
+      - cadeias: Uma sequência de strings a serem verificadas.
+
+    Retorna:
+      - Um array booleano do NumPy com o resultado da verificação de cada cadeia.
+    """
+    import numpy as np
+    return np.fromiter(map(self.verificar_cadeia, cadeias), dtype=bool)
+
+  def verificar_lote_codificado(self, codigos, comprimentos):
+    """
+    Verifica um lote de cadeias já codificadas (ver Automato.verificar_lote_codificado), decodificando
+    as cadeias e percorrendo-as pela tabela preguiçosa. Requer o NumPy.
+    """
+    import numpy as np
+    if isinstance(codigos, (bytes, bytearray, memoryview)):
+      texto = bytes(codigos).decode('latin-1')
+    else:
+      texto = np.asarray(codigos, dtype=np.uint32).tobytes().decode('utf-32-le', 'surrogatepass')
+    limites = np.concatenate(([0], np.cumsum(comprimentos))).tolist()
+    return self.verificar_lote(texto[inicio:fim] for inicio, fim in zip(limites, limites[1:]))
+
+  def verificar_cadeia_paralela(self, cadeia, processos=None):
+    """
+    Não suportado: a execução em paralelo requer a tabela compilada (use materializar().verificar_cadeia_paralela).
+    """
+    raise TypeError('A execução em paralelo requer uma tabela compilada; use materializar() antes.')
+
+  def percorrer_paralelo(self, cadeia, processos=None):
+    """
+    Não suportado: a execução em paralelo requer a tabela compilada (use materializar().percorrer_paralelo).
+    """
+    raise TypeError('A execução em paralelo requer uma tabela compilada; use materializar() antes.')
+
+
+def de_expressao(regex, alfabeto=(), limite_estados=LIMITE_ESTADOS):
+  """
+  Cria o autômato preguiçoso de uma expressão regular, sem a construção de subconjuntos.
+
+  Parâmetros:
+    - regex: O texto da expressão regular (mesma sintaxe de expressao_regular.compilar).
+    - alfabeto: Símbolos a serem incluídos no alfabeto além dos usados na expressão.
+    - limite_estados: A quantidade máxima de estados determinísticos guardados em memória.
+
+  Retorna:
+    - O AutomatoPreguicoso da expressão.
+  """
+  afn = expressao_regular.thompson(expressao_regular.Analisador(regex).analisar())
+  return AutomatoPreguicoso(afn, alfabeto, limite_estados)
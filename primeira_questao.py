@@ -1,46 +1,8 @@
 """
 O seguinte algoritmo tem como objetivo simular um autômato finito que seja capaz de validar se uma cadeia é aceita ou rejeitada.
 """
-class Automato:
-  """
-  Classe Automato responsável por instanciar automatos que reconheçam a cadeia informada.
-  """
-  def __init__(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais): # Método para inicialização da classe
-    """
-    Inicializa a classe Automato.
-
-    Atributos:
-      - estados: Uma lista de estados possíveis para o autômato.
-      - alfabeto: Uma lista de símbolos que formam o alfabeto reconhecido pelo autômato.
-      - transicoes: Um dicionário que define as transições permitidas entre os estados do autômato.
-      - estadoInicial: O estado inicial do autômato.
-      - estadosFinais: Uma lista de estados finais do autômato, representando a aceitação da palavra.
-    """
-    self._estados = estados
-    self._alfabeto = alfabeto
-    self._transicoes = transicoes
-    self._estadoInicial = estadoInicial
-    self._estadosFinais = estadosFinais
-
-  def verificar_cadeia(self, cadeia):
-    """
-    Verifica se a cadeia fornecida é reconhecida pelo autômato.
-
-    Parâmetros:
-      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
-
-    Retorna:
-      - True se a cadeia for aceita pelo autômato, False caso contrário.
-    """
-    conj_alfabeto = self._alfabeto
-    conj_teste = set(cadeia)
-    if not conj_teste - conj_alfabeto:  
-      estado_atual = self._estadoInicial
-      for simbolo in cadeia:
-        estado_atual = self._transicoes.get((estado_atual, simbolo))
-      return estado_atual in self._estadosFinais
-    else:
-      return False
+from automato import Automato
+from produto import AutomatoProduto
 
 '''
 Definição de cada autômato, de "a" a "d", em que:
@@ -122,42 +84,17 @@ estadoInicial_d = 'q0'
 estadosFinais_d = {'q1','q2'}
 automatoD = Automato(estados_d, alfabeto_d, transicoes_d, estadoInicial_d, estadosFinais_d)
 
-# Obtendo dados do usuário: informa o autômato desejado e cadeia a ser analisada
+# Produto dos quatro autômatos: uma única leitura informa o resultado de cada um
+automatos = AutomatoProduto([automatoA, automatoB, automatoC, automatoD])
 
-# Escolha do autômato
-while True:
-  escolheAut = int(input('''
+# Menu de escolha do autômato e cadeias dos testes automáticos
+MENU = '''
 1 - Autômato A: (ab*c*)*
 2 - Autômato B: aaa(b|c)*|(b|c)*aaa
 3 - Autômato C: a*b|ab*
 4 - Autômato D: a*b*(a|ac*)
-Informe o número do autômato que realizará a validação: '''))
-  if escolheAut <= 0 or escolheAut >= 5:
-    print('Erro! Escolha inválida.')
-    continue
-  break
-  
-# Escolha da cadeia
-cadeiaTeste = input("Informe a cadeia a ser analisada: ")
-
-# Validação da cadeia a partir de um autômato
-if escolheAut == 1:
-    verifica = automatoA.verificar_cadeia(cadeiaTeste)
-elif escolheAut == 2:
-    verifica = automatoB.verificar_cadeia(cadeiaTeste)
-elif escolheAut == 3:
-    verifica = automatoC.verificar_cadeia(cadeiaTeste)
-else:
-    verifica = automatoD.verificar_cadeia(cadeiaTeste)
+Informe o número do autômato que realizará a validação: '''
 
-if verifica:
-   print("A cadeia é RECONHECIDA pelo autômato")
-else:
-   print("A cadeia é REJEITADA pelo autômato.")
-   
-# Testes automáticos: iterar uma lista de cadeias pré determinadas e indicar se o autômato escolhido as reconhece ou não
-print('\n')
-print(f"### Testes automáticos com o autômato {escolheAut} ###")
 testes = [
     '','ac', 'a','abbbbc', 'abcc',                       
     'aaacbccb', 'aaabcbcbbcc', 'baaa', 'caaa', 'aaabcc', 
@@ -165,16 +102,34 @@ testes = [
     'aaabbbac', 'bbaaaaccc', 'bba', 'aaaaaa', 'aabacc'   
 ]
 
-for teste in testes:
-    if escolheAut == 1:
-        verifica = automatoA.verificar_cadeia(teste)
-    elif escolheAut == 2:
-       verifica = automatoB.verificar_cadeia(teste)
-    elif escolheAut == 3:
-       verifica = automatoC.verificar_cadeia(teste)
-    else:
-       verifica = automatoD.verificar_cadeia(teste) 
-    if verifica:
-        print(f"A cadeia {teste} é RECONHECIDA pelo autômato")
-    else:
-        print(f"A cadeia {teste} é REJEITADA pelo autômato.")   
+if __name__ == '__main__':
+  # Obtendo dados do usuário: informa o autômato desejado e cadeia a ser analisada
+
+  # Escolha do autômato
+  while True:
+    escolheAut = int(input(MENU))
+    if escolheAut <= 0 or escolheAut >= 5:
+      print('Erro! Escolha inválida.')
+      continue
+    break
+  
+  # Escolha da cadeia
+  cadeiaTeste = input("Informe a cadeia a ser analisada: ")
+
+  # Validação da cadeia a partir de um autômato
+  verifica = automatos.classificar(cadeiaTeste)[escolheAut - 1]
+
+  if verifica:
+     print("A cadeia é RECONHECIDA pelo autômato")
+  else:
+     print("A cadeia é REJEITADA pelo autômato.")
+   
+  # Testes automáticos: iterar uma lista de cadeias pré determinadas e indicar se o autômato escolhido as reconhece ou não
+  print('\n')
+  print(f"### Testes automáticos com o autômato {escolheAut} ###")
+  for teste in testes:
+      verifica = automatos.classificar(teste)[escolheAut - 1]
+      if verifica:
+          print(f"A cadeia {teste} é RECONHECIDA pelo autômato")
+      else:
+          print(f"A cadeia {teste} é REJEITADA pelo autômato.")   
@@ -0,0 +1,116 @@
+"""
+O seguinte algoritmo tem como objetivo verificar uma cadeia em vários autômatos com uma única
+leitura. O autômato produto percorre todos os componentes ao mesmo tempo: cada estado é um tuple
+com um estado de cada componente e carrega o vetor de pertinência (quais componentes aceitam).
+Apenas os tuples alcançáveis a partir do inicial são construídos, e o resultado é minimizado
+preservando os vetores, de forma que o custo de cada símbolo não depende da quantidade de autômatos.
+"""
+import automato
+from minimizacao import quociente
+
+class AutomatoProduto(automato.Automato):
+  """
+  Classe AutomatoProduto responsável por instanciar o produto de vários autômatos. O autômato produto
+  aceita as cadeias aceitas por pelo menos um componente, e classificar informa quais as aceitam.
+  """
+  def __init__(self, automatos):
+    """
+    Inicializa o autômato produto. A construção é feita apenas na primeira verificação.
+
+    Parâmetros:
+      - automatos: Uma sequência de autômatos (qualquer autômato que possua compilar_tabela,
+        inclusive os preguiçosos e os próprios produtos).
+
+    Atributos:
+      - automatos: A lista de autômatos componentes.
+    """
+    self.automatos = list(automatos)
+    alfabeto = set()
+    for componente in self.automatos:
+      alfabeto |= set(componente._alfabeto)
+    super().__init__(None, alfabeto, None, 'q0', None)
+    self._vetores = None # Vetor de pertinência de cada número de estado da tabela
+
+  def _construir(self):
+    """
+    Constrói o produto dos tuples alcançáveis e o minimiza preservando os vetores de pertinência.
+    """
+    tabelas = [componente.compilar_tabela() for componente in self.automatos]
+    simbolos = sorted(self._alfabeto, key=str)
+    nenhum = (False,) * len(tabelas)
+
+    # Busca em largura pelos tuples alcançáveis; o tuple em que todos os componentes estão no estado
+    # morto é o estado morto do produto e fica implícito
+    inicial = tuple(tabela.inicial for tabela in tabelas)
+    mortos = tuple(tabela.morto for tabela in tabelas)
+    tuples = [inicial]
+    numeros = {inicial: 0}
+    transicoes = {}
+    for origem, atual in enumerate(tuples):
+      for simbolo in simbolos:
+        destino = tuple(tabela.avancar(estado, simbolo) for tabela, estado in zip(tabelas, atual))
+        if destino == mortos:
+          continue
+        numero = numeros.get(destino)
+        if numero is None:
+          numero = numeros[destino] = len(tuples)
+          tuples.append(destino)
+        transicoes[(origem, simbolo)] = numero
+    vetores = [tuple(estado in tabela.finais for tabela, estado in zip(tabelas, atual)) for atual in tuples]
+
+    # Minimização: cada estado é rotulado pelo seu vetor, e o estado morto pelo vetor vazio
+    tabela = automato.TabelaCompilada(range(len(tuples)), simbolos, transicoes, 0, set())
+    rotulos = [vetores[numero] for numero in tabela.nomes] + [nenhum]
+    novos, transicoes, representantes, _ = quociente(tabela, rotulos)
+    vetor_de = {novo: rotulos[estado] if estado is not None else nenhum
+                for novo, estado in zip(novos, representantes)}
+
+    self._estados = set(novos)
+    self._transicoes = transicoes
+    self._estadosFinais = {novo for novo, vetor in vetor_de.items() if any(vetor)}
+    self._tabela = automato.TabelaCompilada(self._estados, self._alfabeto, self._transicoes,
+                                            self._estadoInicial, self._estadosFinais)
+    self._vetores = [vetor_de[nome] for nome in self._tabela.nomes] + [nenhum]
+
+  def compilar_tabela(self):
+    """
+    Constrói o produto mínimo na primeira chamada e devolve a sua tabela.
+
+    Retorna:
+      - A TabelaCompilada do produto mínimo.
+    """
+    if self._tabela is None:
+      self._construir()
+    return self._tabela
+
+  def _novo(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais):
+    """
+    Os autômatos construídos a partir deste (como o mínimo) são autômatos comuns.
+    """
+    return automato.Automato(estados, alfabeto, transicoes, estadoInicial, estadosFinais)
+
+  def classificar(self, cadeia):
+    """
+    Verifica a cadeia em todos os componentes com uma única leitura.
+
+    Parâmetros:
+      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
+
+    Retorna:
+      - Um tuple com o resultado de verificar_cadeia de cada componente, na ordem de automatos.
+    """
+    tabela = self._tabela or self.compilar_tabela()
+    return self._vetores[tabela.avancar(tabela.inicial, cadeia) // tabela.largura]
+
+  def vetor(self, estado):
+    """
+    Obtém o vetor de pertinência de um estado do produto mínimo.
+
+    Parâmetros:
+      - estado: O nome do estado ('q0', 'q1', ...).
+
+    Retorna:
+      - Um tuple que indica, para cada componente, se o estado é final.
+    """
+    tabela = self.compilar_tabela()
+    return self._vetores[tabela.nomes.index(estado)]
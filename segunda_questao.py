@@ -4,47 +4,14 @@ as ocorrências da palavra 'computador'.
 Esse script utiliza o autômato criado como mecanismo para contar as ocorrências e posições
 da palavra 'computador' dentro de um texto qualquer.
 """
-class Automato:
+import automato
+import corpus
+import varredura
+
+class Automato(automato.Automato):
   """
   Classe Automato responsável por instanciar automatos que reconheçam a palavra 'computador'.
   """
-  def __init__(self, estados, alfabeto, transicoes, estadoInicial, estadosFinais): # Método para inicialização da classe
-    """  
-    Inicializa a classe Automato.
-
-    Atributos:
-      - estados: Uma lista de estados possíveis para o autômato.
-      - alfabeto: Uma lista de símbolos que formam o alfabeto reconhecido pelo autômato.
-      - transicoes: Um dicionário que define as transições permitidas entre os estados do autômato.
-      - estadoInicial: O estado inicial do autômato.
-      - estadosFinais: Uma lista de estados finais do autômato, representando a aceitação da palavra.
-    """
-    self._estados = estados
-    self._alfabeto = alfabeto
-    self._transicoes = transicoes
-    self._estadoInicial = estadoInicial
-    self._estadosFinais = estadosFinais
-
-  def verificar_cadeia(self, cadeia):
-    """
-    Verifica se a cadeia fornecida é reconhecida pelo autômato.
-
-    Parâmetros:
-      - cadeia: Uma string contendo a cadeia de símbolos a ser verificada.
-
-    Retorna:
-      - True se a cadeia for aceita pelo autômato, False caso contrário.
-    """
-    conj_alfabeto = self._alfabeto
-    conj_teste = set(cadeia)
-    if not conj_teste - conj_alfabeto:
-      estado_atual = self._estadoInicial
-      for simbolo in cadeia:
-        estado_atual = self._transicoes.get((estado_atual, simbolo))
-      return estado_atual in self._estadosFinais
-    else:
-      return False
-
   def texto_limpo(self, texto):
     """
     Remove pontuações do texto fornecido.
@@ -60,25 +27,21 @@ class Automato:
     texto_limpo = re.sub(padrao, '', texto)
     return texto_limpo
   
-  def ocorrencia_posicao(self, texto):
+  def ocorrencia_posicao_arquivo(self, caminho, processos=None):
     """
-    Verifica as ocorrências e as posições da palavra 'computador' em um texto.
+    Verifica as ocorrências e as posições da palavra 'computador' em um arquivo de texto UTF-8,
+    dividindo a varredura entre vários processos.
 
     Parâmetros:
-      - texto: Uma string contendo o texto em que serão buscadas as ocorrências.
+      - caminho: O caminho do arquivo.
+      - processos: A quantidade de processos (por padrão, a quantidade de processadores).
 
     Retorna:
-      - Um tuple contendo o número de ocorrências encontradas e uma lista com as posições das ocorrências.
+      - Um tuple contendo o número de ocorrências encontradas e uma lista com as posições das
+        ocorrências, as mesmas de ocorrencia_posicao sobre o conteúdo do arquivo.
     """
-    text_format = self.texto_limpo(texto)
-    text_format = text_format.split()
-    contadorOcorrencias = 0
-    posicoesTexto = []
-    for indice, cadeia in enumerate(text_format):
-      if self.verificar_cadeia(cadeia):
-        contadorOcorrencias += 1
-        posicoesTexto.append(indice+1)
-    return contadorOcorrencias, posicoesTexto
+    posicoesTexto = [indice for indice, _, _ in corpus.ocorrencias_arquivo(self.compilar_tabela(), caminho, processos)]
+    return len(posicoesTexto), posicoesTexto
     
 
 # Definindo representação algebrica do automato
@@ -133,14 +96,15 @@ No mundo do desenvolvimento de software, a colaboração entre equipes é facili
 
 lista_textos = [texto1, texto2, texto3, texto4, texto5, texto6, texto7, texto8, texto9, texto10, texto11, texto12, texto13, texto14, texto15]
 
-for indice, item in enumerate(lista_textos):
-  print(f'TEXTO {indice + 1}:')
-  ocorrencia, posicao = automatoComputador.ocorrencia_posicao(item)
-  if ocorrencia == 0:
-    print("Não houve ocorrencias")
-  else:
-    print(f'''
+if __name__ == '__main__':
+  for indice, item in enumerate(lista_textos):
+    print(f'TEXTO {indice + 1}:')
+    ocorrencia, posicao = automatoComputador.ocorrencia_posicao(item)
+    if ocorrencia == 0:
+      print("Não houve ocorrencias")
+    else:
+      print(f'''
       Há {ocorrencia} ocorrências da palavra "computador" no texto informado. 
       as posições do aparecimento da palavra "computador" no texto são: {posicao} 
       ''')
-  print('\n') 
\ No newline at end of file
+    print('\n')
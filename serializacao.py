@@ -0,0 +1,222 @@
+"""
+O seguinte algoritmo tem como objetivo gravar autômatos compilados (TabelaCompilada) e Máquinas de
+Moore compiladas (moore.MooreCompilada) em um formato binário versionado, que é carregado por mmap sem
+cópia da tabela de transições. Processos que carregam o mesmo arquivo compartilham a mesma cópia física
+da tabela (o cache de páginas do sistema operacional) e não precisam reconstruir os dicionários.
+
+Formato (inteiros little-endian):
+  - Cabeçalho (CABECALHO): assinatura, versão, tipo (TIPO_AUTOMATO ou TIPO_MOORE), quantidade de
+    estados (sem o estado morto), largura, deslocamento do estado inicial, código da saída de inválido
+    e as posições das seções de finais, de códigos de saída e de textos.
+  - Transições: int32 para cada posição de delta, logo após o cabeçalho.
+  - Finais: um bit por número de estado (incluindo o estado morto, que nunca é final).
+  - Códigos de saída (apenas Máquinas de Moore): um byte por posição de delta.
+  - Textos: três listas de strings UTF-8 (símbolos, nomes dos estados e símbolos de saída), cada uma
+    com a quantidade de strings, o tamanho de cada uma e o conteúdo.
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+import automato
+import moore
+
+ASSINATURA = b'AUTB'
+VERSAO = 1
+TIPO_AUTOMATO = 0
+TIPO_MOORE = 1
+CABECALHO = struct.Struct('<4sHHIIIIQQQ')
+INTEIRO = struct.Struct('<I')
+
+def _escrever_textos(textos):
+  """
+  Codifica uma lista de strings: quantidade, tamanho de cada string e conteúdo.
+  """
+  codificados = [str(texto).encode('utf-8') for texto in textos]
+  tamanhos = array('I', map(len, codificados))
+  if sys.byteorder == 'big':
+    tamanhos.byteswap()
+  return INTEIRO.pack(len(codificados)) + tamanhos.tobytes() + b''.join(codificados)
+
+
+def _ler_textos(dados, posicao):
+  """
+  Decodifica uma lista de strings gravada por _escrever_textos.
+
+  Retorna:
+    - Um tuple contendo a lista de strings e a posição logo após ela.
+  """
+  quantidade, = INTEIRO.unpack_from(dados, posicao)
+  posicao += INTEIRO.size
+  tamanhos = struct.unpack_from(f'<{quantidade}I', dados, posicao)
+  posicao += 4 * quantidade
+  if posicao + sum(tamanhos) > len(dados):
+    raise ValueError('A seção de textos está truncada.')
+  textos = []
+  for tamanho in tamanhos:
+    textos.append(bytes(dados[posicao:posicao + tamanho]).decode('utf-8'))
+    posicao += tamanho
+  return textos, posicao
+
+
+def serializar(objeto):
+  """
+  Converte um autômato ou uma Máquina de Moore compilada para o formato binário.
+
+  Parâmetros:
+    - objeto: Um Automato (ou qualquer autômato cuja compilar_tabela devolva uma TabelaCompilada),
+      uma moore.MooreCompilada ou um objeto com o atributo compilada, como a MaquinaRefri.
+
+  Retorna:
+    - Os bytes do arquivo. Os nomes dos estados são gravados como strings (convertidos por str),
+      enquanto os símbolos de entrada e de saída precisam ser strings, pois são lidos de volta exatamente
+      como foram gravados; caso contrário, é levantado um ValueError.
+  """
+  maquina = getattr(objeto, 'compilada', objeto)
+  if isinstance(maquina, moore.MooreCompilada):
+    tipo, tabela = TIPO_MOORE, maquina.tabela
+  else:
+    tipo, tabela, maquina = TIPO_AUTOMATO, objeto.compilar_tabela(), None
+  if not isinstance(tabela, automato.TabelaCompilada):
+    raise TypeError(f'Apenas tabelas compiladas podem ser serializadas, não {type(tabela).__name__}.')
+  simbolos_saida = maquina.simbolos_saida if maquina is not None else []
+  for simbolo in (*tabela.simbolos, *simbolos_saida):
+    if not isinstance(simbolo, str): # Ex.: a moeda 1 seria lida de volta como '1' e passaria a ser inválida
+      raise ValueError(f'Apenas símbolos do tipo str podem ser serializados, não {simbolo!r}.')
+  if len(tabela.delta) >= 1 << 31:
+    raise ValueError('A tabela de transições excede o limite de 2**31 posições do formato.')
+
+  delta = array('i', tabela.delta)
+  if sys.byteorder == 'big':
+    delta.byteswap()
+  finais = bytearray((len(tabela.nomes) + 8) // 8)
+  for deslocamento in tabela.finais:
+    numero = deslocamento // tabela.largura
+    finais[numero >> 3] |= 1 << (numero & 7)
+  codigos = b''
+  codigo_invalida = 0
+  if maquina is not None:
+    if len(simbolos_saida) > 256:
+      raise ValueError('O formato admite no máximo 256 saídas distintas.')
+    codigos = bytes(maquina.codigo)
+    codigo_invalida = maquina.codigo_invalida
+
+  posicao_finais = CABECALHO.size + 4 * len(delta)
+  posicao_codigos = posicao_finais + len(finais)
+  posicao_textos = posicao_codigos + len(codigos)
+  cabecalho = CABECALHO.pack(ASSINATURA, VERSAO, tipo, len(tabela.nomes), tabela.largura, tabela.inicial,
+                             codigo_invalida, posicao_finais, posicao_codigos, posicao_textos)
+  textos = b''.join(_escrever_textos(lista) for lista in (tabela.simbolos, tabela.nomes, simbolos_saida))
+  return cabecalho + delta.tobytes() + bytes(finais) + codigos + textos
+
+
+def salvar(objeto, caminho):
+  """
+  Grava um autômato ou uma Máquina de Moore compilada em um arquivo (ver serializar).
+
+  Parâmetros:
+    - objeto: O objeto a ser gravado.
+    - caminho: O caminho do arquivo.
+  """
+  with open(caminho, 'wb') as arquivo:
+    arquivo.write(serializar(objeto))
+
+
+class TabelaMapeada(automato.TabelaCompilada):
+  """
+  Classe TabelaMapeada responsável por representar uma TabelaCompilada lida de um arquivo mapeado em
+  memória, em que delta é uma visão (memoryview) do próprio arquivo. Ao ser enviada a outro processo,
+  a tabela é mapeada de novo a partir do arquivo, em vez de ser copiada.
+  """
+  def __init__(self, caminho):
+    """
+    Mapeia o arquivo e lê a tabela.
+
+    Atributos:
+      - caminho: O caminho do arquivo.
+      - tipo: O tipo do conteúdo (TIPO_AUTOMATO ou TIPO_MOORE).
+      - codigos: Uma visão do arquivo com o código de saída de cada posição de delta (vazia para autômatos).
+      - simbolos_saida: A lista de símbolos de saída (vazia para autômatos).
+      - codigo_invalida: O código da saída de uma entrada inválida.
+      - Os demais atributos são os da TabelaCompilada.
+    """
+    with open(caminho, 'rb') as arquivo:
+      self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    dados = memoryview(self._mapa)
+    if len(dados) < CABECALHO.size:
+      raise ValueError(f'O arquivo {caminho!r} não contém um autômato serializado.')
+    (assinatura, versao, tipo, quantidade, largura, inicial, codigo_invalida,
+     posicao_finais, posicao_codigos, posicao_textos) = CABECALHO.unpack_from(dados)
+    if assinatura != ASSINATURA:
+      raise ValueError(f'O arquivo {caminho!r} não contém um autômato serializado.')
+    if versao != VERSAO:
+      raise ValueError(f'Versão {versao} do formato não suportada (esperada: {VERSAO}).')
+    if tipo not in (TIPO_AUTOMATO, TIPO_MOORE):
+      raise ValueError(f'Tipo {tipo} de conteúdo desconhecido no arquivo {caminho!r}.')
+    if not CABECALHO.size <= posicao_finais <= posicao_codigos <= posicao_textos <= len(dados):
+      raise ValueError(f'O arquivo {caminho!r} está truncado ou corrompido.')
+    tamanho_delta = (quantidade + 1) * largura
+    tamanho_codigos = tamanho_delta if tipo == TIPO_MOORE else 0
+    if (posicao_finais - CABECALHO.size != 4 * tamanho_delta
+        or posicao_codigos - posicao_finais != (quantidade + 8) // 8
+        or posicao_textos - posicao_codigos != tamanho_codigos):
+      raise ValueError(f'O arquivo {caminho!r} está truncado ou corrompido.')
+
+    self.caminho = caminho
+    self.tipo = tipo
+    self.largura = largura
+    self.morto = quantidade * largura
+    self.inicial = inicial
+    self.codigo_invalida = codigo_invalida
+    self.delta = dados[CABECALHO.size:posicao_finais].cast('i')
+    if sys.byteorder == 'big': # O arquivo é little-endian: sem cópia apenas em máquinas little-endian
+      delta = array('i', self.delta)
+      delta.byteswap()
+      self.delta = delta
+    self.codigos = dados[posicao_codigos:posicao_textos]
+
+    bits = dados[posicao_finais:posicao_codigos]
+    self.finais = frozenset((indice * 8 + bit) * largura for indice, byte in enumerate(bits) if byte
+                            for bit in range(8) if byte >> bit & 1)
+    try:
+      self.simbolos, posicao = _ler_textos(dados, posicao_textos)
+      self.nomes, posicao = _ler_textos(dados, posicao)
+      self.simbolos_saida, _ = _ler_textos(dados, posicao)
+    except (struct.error, UnicodeDecodeError, ValueError) as erro:
+      raise ValueError(f'O arquivo {caminho!r} está truncado ou corrompido.') from erro
+    self.classes = {simbolo: classe for classe, simbolo in enumerate(self.simbolos)}
+
+  def __reduce__(self):
+    """
+    Envia apenas o caminho do arquivo a outros processos, que o mapeiam de novo.
+    """
+    return (TabelaMapeada, (self.caminho,))
+
+
+def carregar(caminho):
+  """
+  Carrega um arquivo gravado por salvar.
+
+  Parâmetros:
+    - caminho: O caminho do arquivo.
+
+  Retorna:
+    - Um Automato (cuja definição está disponível apenas pela tabela compilada) ou uma
+      moore.MooreCompilada (que pode ser usada em MaquinaRefri(compilada)), conforme o arquivo.
+  """
+  tabela = TabelaMapeada(caminho)
+  if tabela.tipo == TIPO_AUTOMATO:
+    carregado = automato.Automato(None, set(tabela.simbolos), None, tabela.nomes[0], None)
+    carregado._tabela = tabela
+    return carregado
+
+  # Máquina de Moore: os códigos de saída são usados diretamente do arquivo
+  maquina = moore.MooreCompilada.__new__(moore.MooreCompilada)
+  maquina.tabela = tabela
+  maquina.simbolos_saida = tabela.simbolos_saida
+  maquina.codigo = tabela.codigos
+  maquina.saida = [tabela.simbolos_saida[codigo] for codigo in tabela.codigos]
+  maquina.invalida = tabela.simbolos_saida[tabela.codigo_invalida]
+  maquina.codigo_invalida = tabela.codigo_invalida
+  return maquina
@@ -0,0 +1,286 @@
+"""
+O seguinte algoritmo tem como objetivo atender, com asyncio, muitas sessões simultâneas da máquina de
+refrigerante da terceira questão. Todas as sessões compartilham a mesma máquina compilada e cada uma
+guarda apenas o deslocamento do seu estado corrente, em um dicionário indexado pelo identificador da
+sessão. As moedas recebidas entram em uma fila e são aplicadas em pequenos lotes por uma única tarefa,
+e as sessões ociosas são descartadas por gerações: a cada intervalo, as sessões que não receberam
+moedas desde o intervalo anterior são removidas, sem guardar o instante de uso de cada sessão.
+
+Protocolo TCP (ver servir e conectar): cada linha enviada contém o identificador da sessão seguido das
+moedas, separados por espaços, e a resposta é uma linha com as saídas correspondentes, as mesmas de
+MaquinaRefri.ligar.
+"""
+import argparse
+import asyncio
+import contextlib
+
+from terceira_questao import MaquinaRefri
+
+TAMANHO_LOTE = 1024
+# Segundos sem moedas após os quais uma sessão pode ser descartada (é descartada entre 1x e 2x esse tempo)
+TEMPO_OCIOSO = 60.0
+
+class ServidorSessoes:
+  """
+  Classe ServidorSessoes responsável por multiplexar sessões de uma Máquina de Moore compilada.
+  Uma sessão é criada no estado inicial ao receber a primeira moeda, e uma sessão descartada por
+  ociosidade recomeça do estado inicial.
+  """
+  def __init__(self, maquina=None, tamanho_lote=TAMANHO_LOTE, tempo_ocioso=TEMPO_OCIOSO, limite_fila=0):
+    """
+    Inicializa o servidor, sem iniciar as suas tarefas (ver iniciar).
+
+    Parâmetros:
+      - maquina: A moore.MooreCompilada executada (por padrão, a da MaquinaRefri).
+      - tamanho_lote: A quantidade máxima de pedidos aplicados de uma vez.
+      - tempo_ocioso: O tempo, em segundos, após o qual uma sessão sem moedas pode ser descartada.
+      - limite_fila: A quantidade máxima de pedidos aguardando na fila (0 para ilimitada); quando a
+        fila está cheia, enviar aguarda.
+
+    Atributos:
+      - maquina: A máquina compilada compartilhada pelas sessões.
+      - lotes: A quantidade de lotes aplicados.
+      - pedidos: A quantidade de pedidos aplicados.
+      - expiradas: A quantidade de sessões descartadas por ociosidade.
+    """
+    self.maquina = maquina if maquina is not None else MaquinaRefri.compilada
+    self.tamanho_lote = tamanho_lote
+    self.tempo_ocioso = tempo_ocioso
+    self.limite_fila = limite_fila
+    self.lotes = 0
+    self.pedidos = 0
+    self.expiradas = 0
+    self._ativas = {} # Sessões que receberam moedas na geração atual: identificador -> deslocamento do estado
+    self._anteriores = {} # Sessões da geração anterior, descartadas na próxima troca de geração
+    self._fila = None
+    self._tarefas = []
+
+  async def iniciar(self):
+    """
+    Inicia as tarefas de aplicação dos lotes e de descarte das sessões ociosas.
+    """
+    if self._tarefas:
+      return
+    self._fila = asyncio.Queue(self.limite_fila)
+    self._tarefas = [asyncio.create_task(self._processar()), asyncio.create_task(self._expirar())]
+
+  async def encerrar(self):
+    """
+    Aguarda a aplicação dos pedidos já enviados e encerra as tarefas. As sessões são mantidas.
+    """
+    if not self._tarefas:
+      return
+    await self._fila.join()
+    for tarefa in self._tarefas:
+      tarefa.cancel()
+    for tarefa in self._tarefas:
+      with contextlib.suppress(asyncio.CancelledError):
+        await tarefa
+    self._tarefas = []
+
+  async def __aenter__(self):
+    await self.iniciar()
+    return self
+
+  async def __aexit__(self, *excecao):
+    await self.encerrar()
+
+  async def enviar(self, sessao, moedas):
+    """
+    Envia moedas para uma sessão.
+
+    Parâmetros:
+      - sessao: O identificador da sessão (qualquer valor que possa ser chave de dicionário).
+      - moedas: Uma sequência de strings com as moedas, aplicadas em ordem.
+
+    Retorna:
+      - Uma string com as saídas de cada moeda, a mesma de MaquinaRefri.ligar. Um pedido malformado
+        levanta a exceção correspondente (por exemplo, TypeError) apenas para quem o enviou.
+    """
+    if not self._tarefas:
+      raise RuntimeError('O servidor não foi iniciado.')
+    futuro = asyncio.get_running_loop().create_future()
+    await self._fila.put((sessao, moedas, futuro))
+    return await futuro
+
+  def estado(self, sessao):
+    """
+    Obtém o estado corrente de uma sessão.
+
+    Parâmetros:
+      - sessao: O identificador da sessão.
+
+    Retorna:
+      - O estado corrente da sessão, ou None se a sessão não existe (ou foi descartada).
+    """
+    deslocamento = self._ativas.get(sessao, self._anteriores.get(sessao))
+    return None if deslocamento is None else self.maquina.tabela.nome(deslocamento)
+
+  def remover(self, sessao):
+    """
+    Remove uma sessão, que recomeça do estado inicial se receber novas moedas.
+    """
+    self._ativas.pop(sessao, None)
+    self._anteriores.pop(sessao, None)
+
+  def __len__(self):
+    """
+    Retorna a quantidade de sessões existentes.
+    """
+    return len(self._ativas) + len(self._anteriores)
+
+  async def _processar(self):
+    """
+    Retira os pedidos da fila e os aplica em lotes de até tamanho_lote pedidos.
+    """
+    fila = self._fila
+    while True:
+      lote = [await fila.get()]
+      while len(lote) < self.tamanho_lote:
+        try:
+          lote.append(fila.get_nowait())
+        except asyncio.QueueEmpty:
+          break
+      try:
+        self._aplicar(lote)
+      finally:
+        for _ in lote:
+          fila.task_done()
+
+  def _aplicar(self, lote):
+    """
+    Aplica um lote de pedidos (sessão, moedas, futuro), na ordem em que chegaram.
+    """
+    maquina = self.maquina
+    classes = maquina.tabela.classes
+    delta = maquina.tabela.delta
+    saida = maquina.saida
+    invalida = maquina.invalida
+    inicial = maquina.tabela.inicial
+    ativas = self._ativas
+    anteriores = self._anteriores
+    for sessao, moedas, futuro in lote:
+      # Um pedido malformado (identificador ou moeda que não pode ser chave de dicionário, moedas que
+      # não são uma sequência) falha sozinho, sem alterar a sessão e sem interromper o lote
+      try:
+        estado = ativas.get(sessao)
+        if estado is None:
+          estado = anteriores.get(sessao, inicial)
+        produzidas = []
+        for moeda in moedas:
+          classe = classes.get(moeda)
+          if classe is None:
+            produzidas.append(invalida)
+          else:
+            estado = delta[estado + classe]
+            produzidas.append(saida[estado])
+        anteriores.pop(sessao, None)
+        ativas[sessao] = estado
+      except Exception as erro:
+        if not futuro.done():
+          futuro.set_exception(erro)
+        continue
+      if not futuro.done(): # O cliente pode ter desistido de esperar
+        futuro.set_result(''.join(produzidas))
+    self.lotes += 1
+    self.pedidos += len(lote)
+
+  async def _expirar(self):
+    """
+    A cada tempo_ocioso segundos, descarta as sessões da geração anterior e inicia uma nova geração.
+    """
+    while True:
+      await asyncio.sleep(self.tempo_ocioso)
+      self.expiradas += len(self._anteriores)
+      self._anteriores = self._ativas
+      self._ativas = {}
+
+  async def _atender(self, leitor, escritor):
+    """
+    Atende uma conexão TCP, respondendo cada linha com as saídas das moedas recebidas.
+    """
+    try:
+      async for linha in leitor:
+        partes = linha.decode('utf-8').split()
+        if not partes:
+          continue
+        saidas = await self.enviar(partes[0], partes[1:])
+        escritor.write(saidas.encode('utf-8') + b'\n')
+        await escritor.drain()
+    finally:
+      escritor.close()
+
+  async def servir(self, host='127.0.0.1', porta=0):
+    """
+    Inicia o servidor e aceita conexões TCP.
+
+    Parâmetros:
+      - host: O endereço em que o servidor escuta.
+      - porta: A porta (0 para escolher uma porta livre).
+
+    Retorna:
+      - O asyncio.Server criado; a porta escolhida está em servidor.sockets[0].getsockname()[1].
+    """
+    await self.iniciar()
+    return await asyncio.start_server(self._atender, host, porta)
+
+
+class Cliente:
+  """
+  Classe Cliente responsável por enviar moedas a um ServidorSessoes pelo protocolo TCP.
+  """
+  def __init__(self, leitor, escritor):
+    """
+    Inicializa o cliente a partir de uma conexão aberta (ver conectar).
+    """
+    self.leitor = leitor
+    self.escritor = escritor
+
+  async def enviar(self, sessao, moedas):
+    """
+    Envia moedas para uma sessão e aguarda a resposta.
+
+    Parâmetros:
+      - sessao: O identificador da sessão (sem espaços).
+      - moedas: Uma sequência de strings com as moedas.
+
+    Retorna:
+      - A string com as saídas de cada moeda.
+    """
+    self.escritor.write(' '.join([str(sessao), *moedas]).encode('utf-8') + b'\n')
+    await self.escritor.drain()
+    return (await self.leitor.readline()).decode('utf-8').rstrip('\n')
+
+  async def fechar(self):
+    """
+    Fecha a conexão.
+    """
+    self.escritor.close()
+    await self.escritor.wait_closed()
+
+
+async def conectar(host, porta):
+  """
+  Abre uma conexão com um ServidorSessoes.
+
+  Retorna:
+    - O Cliente conectado.
+  """
+  leitor, escritor = await asyncio.open_connection(host, porta)
+  return Cliente(leitor, escritor)
+
+
+async def _principal(host, porta):
+  servidor = ServidorSessoes()
+  tcp = await servidor.servir(host, porta)
+  print(f'Atendendo em {host}:{tcp.sockets[0].getsockname()[1]}')
+  async with tcp:
+    await tcp.serve_forever()
+
+
+if __name__ == '__main__':
+  analisador = argparse.ArgumentParser(description='Servidor de sessões da máquina de refrigerante.')
+  analisador.add_argument('--host', default='127.0.0.1')
+  analisador.add_argument('--porta', type=int, default=8765)
+  opcoes = analisador.parse_args()
+  asyncio.run(_principal(opcoes.host, opcoes.porta))
@@ -5,55 +5,82 @@ refrigerante será disponibilizada somente quando o valor total atingir ou ultra
 Cada moeda inserida terá um resultado específico, podendo ser 0, indicando que a lata não pode 
 ser liberada (ainda), ou 1, sinalizando que a lata deve ser liberada.
 """
+import moore
+
 class MaquinaRefri:
     """
     Classe MaquinaRefri responsável por instanciar um transdutor do tipo Máquina de Moore
     que retorna uma saída de 0 para valores inferiores a 1 real e 1 para valores iguais
     ou superiores a 1 real. Baseado em uma sequencia de moedas de 25 e 50 centavos, e 1 real.
+
+    A definição do transdutor é compilada uma única vez (ver moore.MooreCompilada) e compartilhada
+    por todas as instâncias; cada instância guarda apenas a sua sessão, com o estado corrente.
+
+    Atributos da classe:
+    - estados: Um dicionário que associa cada estado do transdutor a uma descrição.
+    - transicoes: Um dicionário que define as transições permitidas entre os estados do transdutor.
+    - saidas: Um dicionário que associa cada estado do transdutor a uma saída correspondente.
+    - compilada: A Máquina de Moore compilada em tabelas de inteiros.
     """
-    def __init__(self):
+    estados = {
+      '0': "Estado 0 cents",
+      '25': "Estado 25 cents",
+      '50': "Estado 50 cents",
+      '75': "Estado 75 cents",
+      '100': "Estado 100 cents",
+      '125': "Estado 125 cents",
+      '150': "Estado 150 cents",
+      '175': "Estado 175 cents"
+    }
+    # Funções de transição para o transdutor
+    transicoes = {
+        '0': {'25': '25', '50': '50', '100': '100'},
+        '25': {'25': '50', '50': '75', '100': '125'},
+        '50': {'25': '75', '50': '100', '100': '150'},
+        '75': {'25': '100', '50': '125', '100': '175'},
+        '100': {'25': '25', '50': '50', '100': '100'},
+        '125': {'25': '50', '50': '75', '100': '125'},
+        '150': {'25': '75', '50': '100', '100': '150'},
+        '175': {'25': '100', '50': '125', '100': '175'}
+    }
+    # Saídas correspondentes para cada estado do transdutor
+    saidas = {
+        '0': '0',
+        '25': '0',
+        '50': '0',
+        '75': '0',
+        '100': '1',
+        '125': '1',
+        '150': '1',
+        '175': '1'
+    }
+    compilada = moore.MooreCompilada(transicoes, saidas, '0', 'Nr')
+
+    def __init__(self, compilada=None):
         """
         Inicializa a Máquina de Moore do refrigerante.
         
+        Parâmetros:
+        - compilada: Uma máquina compilada a ser usada no lugar da definição da classe, como a
+          carregada de um arquivo por serializacao.carregar.
+        
         Atributos:
-        - estados: Um dicionário que associa cada estado do transdutor a uma descrição.
-        - transicoes: Um dicionário que define as transições permitidas entre os estados do transdutor.
-        - estado_corrente: O estado atual do transdutor.
-        - saidas: Um dicionário que associa cada estado do transdutor a uma saída correspondente.
-        """
-        self.estados = {
-          '0': "Estado 0 cents",
-          '25': "Estado 25 cents",
-          '50': "Estado 50 cents",
-          '75': "Estado 75 cents",
-          '100': "Estado 100 cents",
-          '125': "Estado 125 cents",
-          '150': "Estado 150 cents",
-          '175': "Estado 175 cents"
-        }
-        # Funções de transição para o transdutor
-        self.transicoes = {
-            '0': {'25': '25', '50': '50', '100': '100'},
-            '25': {'25': '50', '50': '75', '100': '125'},
-            '50': {'25': '75', '50': '100', '100': '150'},
-            '75': {'25': '100', '50': '125', '100': '175'},
-            '100': {'25': '25', '50': '50', '100': '100'},
-            '125': {'25': '50', '50': '75', '100': '125'},
-            '150': {'25': '75', '50': '100', '100': '150'},
-            '175': {'25': '100', '50': '125', '100': '175'}
-        }
-        self.estado_corrente = '0'
-        # Saídas correspondentes para cada estado do transdutor
-        self.saidas = {
-            '0': '0',
-            '25': '0',
-            '50': '0',
-            '75': '0',
-            '100': '1',
-            '125': '1',
-            '150': '1',
-            '175': '1'
-        }
+        - sessao: A sessão (moore.Sessao) da máquina compilada, que guarda o estado corrente.
+        """
+        if compilada is not None:
+            self.compilada = compilada
+        self.sessao = self.compilada.sessao()
+
+    @property
+    def estado_corrente(self):
+        """
+        O estado atual do transdutor.
+        """
+        return self.sessao.estado_corrente
+
+    @estado_corrente.setter
+    def estado_corrente(self, estado):
+        self.sessao.estado = self.compilada.deslocamento(estado)
     
     def transitando(self, input):
         """
@@ -65,11 +92,7 @@ class MaquinaRefri:
         Retorna:
         - A saída correspondente ao estado atual após a transição, ou 'Nr' se a entrada for inválida.
         """
-        if input not in ('25', '50', '100'):
-            return 'Nr'
-        proximo_estado = self.transicoes[self.estado_corrente][input]
-        self.estado_corrente = proximo_estado
-        return self.saidas[self.estado_corrente]
+        return self.sessao.transitando(input)
     
     def ligar(self, list_valores):
         """
@@ -81,17 +104,85 @@ class MaquinaRefri:
         Retorna:
         - Uma string contendo as saídas correspondentes a cada transição do transdutor.
         """
-        saidas = ''
-        for valor in list_valores:
-            saidas += self.transitando(valor)
-        return saidas
+        return self.sessao.ligar(list_valores)
+
+    def ligar_stream(self, valores):
+        """
+        Executa a Máquina de Moore à medida que as moedas chegam.
+        
+        Parâmetros:
+        - valores: Um iterável (possivelmente infinito) de strings que representa as moedas inseridas.
+        
+        Retorna:
+        - Um gerador com a saída correspondente a cada moeda.
+        """
+        return self.sessao.ligar_stream(valores)
+
+    def ligar_buffer(self, list_valores):
+        """
+        Executa a Máquina de Moore para uma sequência de moedas, com as saídas em um buffer de bytes.
+        
+        Parâmetros:
+        - list_valores: Uma lista de strings que representa a sequência de moedas inseridas.
+        
+        Retorna:
+        - Um bytearray com o código de cada saída, em que MaquinaRefri.compilada.simbolos_saida[codigo]
+          é a saída correspondente.
+        """
+        return self.sessao.ligar_buffer(list_valores)
+
+    def instrumentar(self, instrumentacao=None):
+        """
+        Ativa a instrumentação de transitando, ligar, ligar_buffer e ligar_stream (visitas aos estados,
+        uso das transições, entradas inválidas e tempo de cada chamada).
+        
+        Parâmetros:
+        - instrumentacao: A instrumentacao.Instrumentacao que recebe as medições (por padrão, uma nova).
+        
+        Retorna:
+        - A Instrumentacao utilizada.
+        """
+        import instrumentacao as modulo
+        if instrumentacao is None:
+            instrumentacao = modulo.Instrumentacao()
+        modulo.instrumentar_moore(self, instrumentacao)
+        return instrumentacao
+
+    def desinstrumentar(self):
+        """
+        Desativa a instrumentação, voltando a executar os métodos sem nenhum custo adicional.
+        """
+        for metodo in ('transitando', 'ligar', 'ligar_buffer', 'ligar_stream'):
+            self.__dict__.pop(metodo, None)
+
+    def ligar_paralelo(self, list_valores, processos=None):
+        """
+        Executa a Máquina de Moore para uma sequência de moedas muito longa, dividindo-a entre
+        vários processos (ver paralelo.executar).
+        
+        Parâmetros:
+        - list_valores: Uma lista de strings que representa a sequência de moedas inseridas.
+        - processos: A quantidade de processos (por padrão, a quantidade de processadores).
+        
+        Retorna:
+        - A mesma string de saídas de ligar.
+        """
+        import paralelo
+        tabela = self.compilada.tabela
+        saidas = self.compilada.saida[::tabela.largura]
+        final, saida = paralelo.executar(tabela, list_valores, processos, ignorar_invalidos=True,
+                                         saidas=saidas, invalido=self.compilada.invalida,
+                                         inicial=self.sessao.estado // tabela.largura)
+        self.sessao.estado = final * tabela.largura
+        return saida
 
 # TESTE DO SCRIPT
 lista_sequencias = [['25', '50', '100'], ['100', '25', '50'], ['50', '100', '25'], ['25', '100', '50'], ['50', '25', '100'], ['100', '50', '25'], ['25', '50', '100', '25'], ['25', '100', '50', '100'], ['50', '100', '25', '50'], ['100', '25', '50', '100'], ['25', '50', '100', '25', '50'], ['25', '100', '50', '100', '25'], ['50', '100', '25', '50', '100'], ['100', '25', '50', '100', '25'], ['25', '50', '100', '25', '50', '100'], ['25', '100', '50', '100', '25', '50'], ['50', '100', '25', '50', '100', '25'], ['100', '25', '50', '100', '25', '50'], ['25', '50', '100', '25', '50', '100', '25'], ['25', '100', '50', '100', '25', '50', '100']]
 
-for sequencia in lista_sequencias:
-  maquina = MaquinaRefri() # Uma nova máquina é criada a cada nova sequência testada.
-  output_sequence = maquina.ligar(sequencia)
-  print(f'Sequencia: {sequencia}')
-  print(f'Saida: {output_sequence}')
-  print('\n')
\ No newline at end of file
+if __name__ == '__main__':
+  for sequencia in lista_sequencias:
+    maquina = MaquinaRefri() # Uma nova máquina é criada a cada nova sequência testada.
+    output_sequence = maquina.ligar(sequencia)
+    print(f'Sequencia: {sequencia}')
+    print(f'Saida: {output_sequence}')
+    print('\n')
\ No newline at end of file
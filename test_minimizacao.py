@@ -0,0 +1,85 @@
+"""
+Testes da minimização de Hopcroft, comparada com o refinamento de Moore feito por força bruta.
+"""
+import itertools
+import random
+import unittest
+
+import equivalencia
+from automato import Automato
+from primeira_questao import automatoC
+
+def automato_aleatorio(gerador):
+  """
+  Sorteia um autômato pequeno, com transições ausentes, estados inalcançáveis e finais quaisquer.
+  """
+  estados = ['e' + str(numero) for numero in range(gerador.randint(1, 7))]
+  alfabeto = set('abc'[:gerador.randint(1, 3)])
+  transicoes = {(origem, simbolo): gerador.choice(estados)
+                for origem in estados for simbolo in sorted(alfabeto) if gerador.random() < 0.8}
+  finais = {estado for estado in estados if gerador.random() < 0.4}
+  return Automato(set(estados), alfabeto, transicoes, estados[0], finais)
+
+
+def estados_minimos(automato):
+  """
+  Quantidade de estados do autômato mínimo pelo refinamento de Moore: começa separando os finais dos
+  não finais e divide os blocos pelas transições até estabilizar. O estado morto (None) participa do
+  refinamento, mas o seu bloco não conta (o mínimo sempre tem ao menos o estado inicial).
+  """
+  simbolos = sorted(automato._alfabeto)
+  alcancados = [automato._estadoInicial, None]
+  for estado in alcancados:
+    for simbolo in simbolos:
+      destino = automato._transicoes.get((estado, simbolo))
+      if destino not in alcancados:
+        alcancados.append(destino)
+  bloco = {estado: estado in automato._estadosFinais for estado in alcancados}
+  while True:
+    assinaturas = {estado: (bloco[estado],) + tuple(bloco[automato._transicoes.get((estado, simbolo))]
+                                                    for simbolo in simbolos)
+                   for estado in alcancados}
+    numeros = {}
+    novo = {estado: numeros.setdefault(assinatura, len(numeros)) for estado, assinatura in assinaturas.items()}
+    if len(numeros) == len(set(bloco.values())):
+      break
+    bloco = novo
+  vivos = {bloco[estado] for estado in alcancados if bloco[estado] != bloco[None]}
+  return max(len(vivos), 1)
+
+
+def cadeias(alfabeto, tamanho):
+  for comprimento in range(tamanho + 1):
+    for simbolos in itertools.product(alfabeto, repeat=comprimento):
+      yield ''.join(simbolos)
+
+
+class TesteMinimizacao(unittest.TestCase):
+  def test_automatos_aleatorios(self):
+    gerador = random.Random(2024)
+    for indice in range(300):
+      original = automato_aleatorio(gerador)
+      minimo, mapeamento = original.minimizar()
+      with self.subTest(indice=indice, transicoes=original._transicoes, finais=original._estadosFinais):
+        self.assertEqual(equivalencia.equivalente(original, minimo), (True, None))
+        for cadeia in cadeias(sorted(original._alfabeto) + ['x'], 5):
+          self.assertEqual(minimo.verificar_cadeia(cadeia), original.verificar_cadeia(cadeia), cadeia)
+        self.assertEqual(len(minimo._estados), estados_minimos(original))
+        self.assertEqual(set(mapeamento), set(original._estados))
+
+  def test_minimo_e_minimo(self):
+    gerador = random.Random(7)
+    for _ in range(50):
+      minimo, _ = automato_aleatorio(gerador).minimizar()
+      de_novo, _ = minimo.minimizar()
+      self.assertEqual(len(de_novo._estados), len(minimo._estados))
+
+  def test_automato_c(self):
+    minimo, mapeamento = automatoC.minimizar()
+    self.assertEqual(len(automatoC._estados), 6)
+    self.assertEqual(len(minimo._estados), 5)
+    self.assertEqual(estados_minimos(automatoC), 5)
+    self.assertEqual(equivalencia.equivalente(automatoC, minimo), (True, None))
+
+if __name__ == '__main__':
+  unittest.main()
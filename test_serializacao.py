@@ -0,0 +1,66 @@
+"""
+Testes da gravação e do carregamento de autômatos e Máquinas de Moore compilados.
+"""
+import os
+import pickle
+import tempfile
+import unittest
+
+import serializacao
+from primeira_questao import automatoB, testes
+from terceira_questao import MaquinaRefri
+
+class TesteSerializacao(unittest.TestCase):
+  def setUp(self):
+    pasta = tempfile.TemporaryDirectory()
+    self.addCleanup(pasta.cleanup)
+    self.pasta = pasta.name
+
+  def caminho(self, nome):
+    return os.path.join(self.pasta, nome)
+
+  def test_automato_ida_e_volta(self):
+    caminho = self.caminho('automato.autb')
+    serializacao.salvar(automatoB, caminho)
+    carregado = serializacao.carregar(caminho)
+    for cadeia in testes + ['aaa', 'bcaaa', 'aaabx', 'x']:
+      self.assertEqual(carregado.verificar_cadeia(cadeia), automatoB.verificar_cadeia(cadeia), cadeia)
+
+  def test_maquina_refri_ida_e_volta(self):
+    caminho = self.caminho('refri.autb')
+    serializacao.salvar(MaquinaRefri(), caminho)
+    moedas = ['25', '50', '25', 'x', '100', '50', '50', '25', '25', '10']
+    self.assertEqual(MaquinaRefri(serializacao.carregar(caminho)).ligar(moedas), MaquinaRefri().ligar(moedas))
+
+  def test_pickle_da_tabela_mapeada(self):
+    caminho = self.caminho('automato.autb')
+    serializacao.salvar(automatoB, caminho)
+    tabela = serializacao.TabelaMapeada(caminho)
+    copia = pickle.loads(pickle.dumps(tabela))
+    self.assertEqual(copia.caminho, caminho)
+    self.assertEqual(list(copia.delta), list(tabela.delta))
+    self.assertEqual(copia.finais, tabela.finais)
+    self.assertEqual(copia.nomes, tabela.nomes)
+    for cadeia in testes:
+      self.assertEqual(copia.aceita(cadeia), tabela.aceita(cadeia), cadeia)
+
+  def test_arquivo_truncado(self):
+    dados = serializacao.serializar(automatoB)
+    for tamanho in (10, serializacao.CABECALHO.size, serializacao.CABECALHO.size + 8, len(dados) - 1):
+      caminho = self.caminho(f'truncado{tamanho}.autb')
+      with open(caminho, 'wb') as arquivo:
+        arquivo.write(dados[:tamanho])
+      with self.assertRaises(ValueError):
+        serializacao.TabelaMapeada(caminho)
+
+  def test_tipo_desconhecido(self):
+    dados = bytearray(serializacao.serializar(automatoB))
+    dados[6] = 7 # O tipo fica logo após a assinatura e a versão
+    caminho = self.caminho('tipo.autb')
+    with open(caminho, 'wb') as arquivo:
+      arquivo.write(dados)
+    with self.assertRaises(ValueError):
+      serializacao.carregar(caminho)
+
+if __name__ == '__main__':
+  unittest.main()
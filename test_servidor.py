@@ -0,0 +1,58 @@
+"""
+Testes do servidor de sessões da máquina de refrigerante.
+"""
+import asyncio
+import unittest
+
+import servidor
+from terceira_questao import MaquinaRefri
+
+class TesteServidorSessoes(unittest.IsolatedAsyncioTestCase):
+  async def test_sessoes_iguais_a_ligar(self):
+    sequencias = {'a': ['25', '50', '100'], 'b': ['50', 'x', '50', '25'], 'c': ['100', '100']}
+    async with servidor.ServidorSessoes() as sessoes:
+      for sessao, moedas in sequencias.items():
+        for moeda in moedas:
+          await sessoes.enviar(sessao, [moeda])
+      for sessao, moedas in sequencias.items():
+        maquina = MaquinaRefri()
+        maquina.ligar(moedas)
+        self.assertEqual(sessoes.estado(sessao), maquina.estado_corrente)
+
+  async def test_pedido_malformado_nao_interrompe_o_servidor(self):
+    sessoes = servidor.ServidorSessoes()
+    await sessoes.iniciar()
+    try:
+      with self.assertRaises(TypeError):
+        await asyncio.wait_for(sessoes.enviar('b', [['25']]), 1)
+      with self.assertRaises(TypeError):
+        await asyncio.wait_for(sessoes.enviar(['nao', 'hashable'], ['25']), 1)
+      self.assertEqual(await asyncio.wait_for(sessoes.enviar('c', ['25', '50', '25']), 1), '001')
+      self.assertIsNone(sessoes.estado('b'))
+    finally:
+      await asyncio.wait_for(sessoes.encerrar(), 1)
+
+  async def test_malformado_no_mesmo_lote(self):
+    async with servidor.ServidorSessoes() as sessoes:
+      resultados = await asyncio.gather(sessoes.enviar('a', ['50']), sessoes.enviar('b', None),
+                                        sessoes.enviar('a', ['50']), return_exceptions=True)
+      self.assertEqual(resultados[0], '0')
+      self.assertIsInstance(resultados[1], TypeError)
+      self.assertEqual(resultados[2], '1')
+      self.assertEqual(sessoes.lotes, 1)
+
+  async def test_loopback(self):
+    sessoes = servidor.ServidorSessoes()
+    tcp = await sessoes.servir()
+    try:
+      cliente = await servidor.conectar('127.0.0.1', tcp.sockets[0].getsockname()[1])
+      self.assertEqual(await cliente.enviar('s1', ['25', '50', '25', 'x']), '001Nr')
+      await cliente.fechar()
+    finally:
+      tcp.close()
+      await tcp.wait_closed()
+      await sessoes.encerrar()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,71 @@
+"""
+Testes da varredura em pedaços, comparada com limpar o texto, separá-lo em palavras e verificar cada uma.
+"""
+import random
+import unittest
+
+import varredura
+from segunda_questao import automatoComputador, texto1
+
+ESPACOS = [' ', '\n', '\t', '\xa0', '\x85', '\u3000', '\x1c', '\u2028']
+PALAVRAS = ['computador', 'Computador', 'computadores', 'computador.', '...computador?!', 'compu.tador',
+            'computa', 'dor', '...', '?!', ',', 'supercomputador', 'computador,computador', 'cómputador']
+
+def referencia(texto):
+  """
+  Numeração das palavras aceitas feita como na segunda questão original: texto_limpo e split.
+  """
+  palavras = automatoComputador.texto_limpo(texto).split()
+  return [indice + 1 for indice, palavra in enumerate(palavras) if automatoComputador.verificar_cadeia(palavra)]
+
+
+def texto_aleatorio(semente, quantidade=300):
+  gerador = random.Random(semente)
+  return ''.join(gerador.choice(PALAVRAS) + ''.join(gerador.choices(ESPACOS, k=gerador.randint(1, 3)))
+                 for _ in range(quantidade))
+
+
+class TesteVarredor(unittest.TestCase):
+  def verificar(self, texto):
+    esperado = referencia(texto)
+    tabela = automatoComputador.compilar_tabela()
+    for tamanho in (1, 2, 3, 7, 1 << 16):
+      with self.subTest(tamanho=tamanho):
+        varredor = varredura.Varredor(tabela)
+        ocorrencias = []
+        for pedaco in varredura.fatiar(texto, tamanho):
+          ocorrencias.extend(varredor.alimentar(pedaco))
+        ocorrencias.extend(varredor.finalizar())
+        self.assertEqual([indice for indice, _, _ in ocorrencias], esperado)
+        self.assertEqual(varredor.palavras, len(automatoComputador.texto_limpo(texto).split()))
+        for _, posicao, _ in ocorrencias:
+          # A posição é a do primeiro caractere da palavra que não é pontuação
+          self.assertNotIn(texto[posicao], varredura.PONTUACAO)
+          self.assertTrue(posicao == 0 or texto[posicao - 1].isspace() or texto[posicao - 1] in varredura.PONTUACAO)
+          palavra = automatoComputador.texto_limpo(texto[posicao:]).split()[0]
+          self.assertTrue(automatoComputador.verificar_cadeia(palavra), palavra)
+
+  def test_texto_da_questao(self):
+    self.verificar(texto1)
+
+  def test_espacos_unicode(self):
+    for espaco in ESPACOS:
+      with self.subTest(espaco=repr(espaco)):
+        self.verificar(espaco.join(['computador', 'x', 'computador.', espaco, 'computador']) + espaco)
+
+  def test_pontuacao_sem_palavra(self):
+    self.verificar('... computador ?! , computador. ;;; computador:')
+    self.verificar('?!' * 10)
+
+  def test_textos_aleatorios(self):
+    for semente in range(20):
+      with self.subTest(semente=semente):
+        self.verificar(texto_aleatorio(semente))
+
+  def test_varrer_igual_ocorrencia_posicao(self):
+    texto = texto_aleatorio(99)
+    esperado = referencia(texto)
+    self.assertEqual(automatoComputador.ocorrencia_posicao(texto), (len(esperado), esperado))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,177 @@
+"""
+O seguinte algoritmo tem como objetivo procurar as ocorrências de uma palavra em um texto lido em
+pedaços, sem montar cópias do texto. O autômato da palavra é estendido com uma transição de falha
+que volta ao estado inicial a cada espaço em branco, e as pontuações são ignoradas, de forma que o
+resultado é o mesmo de limpar o texto, separá-lo em palavras e verificar cada uma delas.
+"""
+import functools
+import itertools
+import re
+
+PONTUACAO = '.,:;?!'
+
+class Varredor:
+  """
+  Classe Varredor responsável por percorrer um texto em pedaços com a tabela compilada de um
+  autômato, guardando entre um pedaço e outro apenas o estado da palavra em andamento.
+  """
+  def __init__(self, tabela, pontuacao=PONTUACAO):
+    """
+    Inicializa o varredor.
+
+    Atributos:
+      - tabela: A TabelaCompilada do autômato que reconhece a palavra (ou outra tabela com a mesma
+        interface: inicial, morto, finais, avancar e nome).
+      - palavras: A quantidade de palavras lidas até o momento.
+      - posicao: A quantidade de caracteres lidos até o momento.
+    """
+    self.tabela = tabela
+    self.palavras = 0
+    self.posicao = 0
+    self._pontuacao = pontuacao
+    self._remover = re.compile('[{}]'.format(re.escape(pontuacao)))
+    # Palavras se repetem muito em textos naturais, então o resultado de cada uma fica em um cache limitado
+    # (exceto nas tabelas com memorizavel falso, como as instrumentadas, que precisam ver todas as palavras)
+    self._destino = functools.partial(tabela.avancar, tabela.inicial)
+    if getattr(tabela, 'memorizavel', True):
+      self._destino = functools.lru_cache(maxsize=1 << 16)(self._destino)
+    # Uma palavra é uma sequência sem espaços com ao menos um caractere que não seja pontuação
+    self._palavra = re.compile(r'[{0}]*([^\s{0}])\S*'.format(re.escape(pontuacao)))
+    self._espaco = re.compile(r'\s')
+    self._pendente = False # Há uma sequência sem espaços que pode continuar no próximo pedaço
+    self._inicio = None # Posição do primeiro caractere da palavra em andamento
+    self._estado = tabela.inicial
+
+  def _continuar(self, texto, posicao):
+    """
+    Lê mais um trecho sem espaços da palavra em andamento.
+
+    Parâmetros:
+      - texto: O trecho da palavra, ainda com as pontuações.
+      - posicao: A posição do trecho no texto.
+    """
+    palavra = self._remover.sub('', texto)
+    if palavra:
+      if self._inicio is None:
+        self.palavras += 1
+        self._inicio = posicao + len(texto) - len(texto.lstrip(self._pontuacao))
+      if self._estado != self.tabela.morto:
+        self._estado = self.tabela.avancar(self._estado, palavra)
+    self._pendente = True
+
+  def _encerrar(self):
+    """
+    Encerra a palavra em andamento.
+
+    Retorna:
+      - Uma lista com a ocorrência (número da palavra, posição do caractere inicial, estado final)
+        se a palavra for aceita.
+    """
+    aceita = self._inicio is not None and self._estado in self.tabela.finais
+    ocorrencias = [(self.palavras, self._inicio, self.tabela.nome(self._estado))] if aceita else []
+    self._pendente = False
+    self._inicio = None
+    self._estado = self.tabela.inicial
+    return ocorrencias
+
+  def alimentar(self, pedaco):
+    """
+    Lê o próximo pedaço do texto.
+
+    Parâmetros:
+      - pedaco: Uma string com a continuação do texto.
+
+    Retorna:
+      - Uma lista com as ocorrências encerradas neste pedaço, cada uma no formato
+        (número da palavra, posição do caractere inicial, estado final). A última palavra do pedaço só é
+        encerrada no pedaço seguinte ou em finalizar().
+    """
+    ocorrencias = []
+    inicio = 0
+    # Começo do pedaço: continuação da palavra que ficou pendente no pedaço anterior
+    if self._pendente:
+      espaco = self._espaco.search(pedaco)
+      inicio = espaco.start() if espaco else len(pedaco)
+      self._continuar(pedaco[:inicio], self.posicao)
+      if espaco:
+        ocorrencias = self._encerrar()
+
+    # Fim do pedaço: a última sequência sem espaços pode continuar no próximo pedaço
+    resto = pedaco[inicio:]
+    cauda = resto.rsplit(None, 1)[-1] if resto and not resto[-1].isspace() else ''
+    corpo = resto[:len(resto) - len(cauda)]
+
+    # Meio do pedaço: palavras completas, limpas e separadas sem percorrer caractere a caractere
+    palavras = self._remover.sub('', corpo).split()
+    finais = self.tabela.finais
+    aceitas = [(indice, estado) for indice, estado in enumerate(map(self._destino, palavras)) if estado in finais]
+    if aceitas:
+      achadas = self._palavra.finditer(corpo)
+      anterior = -1
+      for indice, estado in aceitas:
+        encontrada = next(itertools.islice(achadas, indice - anterior - 1, None))
+        ocorrencias.append((self.palavras + indice + 1, self.posicao + inicio + encontrada.start(1), self.tabela.nome(estado)))
+        anterior = indice
+    self.palavras += len(palavras)
+
+    if cauda:
+      self._continuar(cauda, self.posicao + len(pedaco) - len(cauda))
+    self.posicao += len(pedaco)
+    return ocorrencias
+
+  def finalizar(self):
+    """
+    Indica o fim do texto, encerrando a última palavra.
+
+    Retorna:
+      - Uma lista com a última ocorrência, caso a última palavra seja aceita.
+    """
+    return self._encerrar()
+
+
+def varrer(tabela, fluxo, pontuacao=PONTUACAO):
+  """
+  Procura as palavras aceitas pela tabela em um texto fornecido em pedaços.
+
+  Parâmetros:
+    - tabela: A TabelaCompilada do autômato que reconhece a palavra.
+    - fluxo: Um iterável de strings com os pedaços do texto (por exemplo, ler_blocos(arquivo)).
+    - pontuacao: Os caracteres de pontuação ignorados nas palavras.
+
+  Retorna:
+    - Um gerador de tuples (número da palavra, posição do caractere inicial, estado final), em que
+      as palavras são numeradas a partir de 1, as posições contam os caracteres do texto a partir
+      de 0 e o estado final é o estado do autômato em que a palavra terminou.
+  """
+  varredor = Varredor(tabela, pontuacao)
+  for pedaco in fluxo:
+    yield from varredor.alimentar(pedaco)
+  yield from varredor.finalizar()
+
+
+def ler_blocos(arquivo, tamanho=1 << 16):
+  """
+  Lê um arquivo de texto em blocos de tamanho fixo.
+
+  Parâmetros:
+    - arquivo: Um arquivo aberto em modo texto.
+    - tamanho: A quantidade de caracteres de cada bloco.
+
+  Retorna:
+    - Um gerador com os blocos do arquivo.
+  """
+  return iter(lambda: arquivo.read(tamanho), '')
+
+
+def fatiar(texto, tamanho=1 << 16):
+  """
+  Divide um texto já carregado em pedaços, para que a varredura não precise copiá-lo inteiro.
+
+  Parâmetros:
+    - texto: Uma string com o texto.
+    - tamanho: A quantidade de caracteres de cada pedaço.
+
+  Retorna:
+    - Um gerador com os pedaços do texto.
+  """
+  return (texto[inicio:inicio + tamanho] for inicio in range(0, len(texto), tamanho))